@@ -0,0 +1,108 @@
+"""Micro-benchmark: sliding window RateLimiter vs GCRARateLimiter.
+
+Simulates a high call rate by raising the limits so that the sliding window
+limiter has to keep (and trim) a large history, then times the calls made
+for every request: can_request(), wait_time() and record_request().
+
+Run from the repository root:
+
+  python benchmarks/bench_rate_limiter.py
+  python benchmarks/bench_rate_limiter.py --calls 200000 --limit 50000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from zrdatafetch.rate_limiter import (  # noqa: E402
+  GCRARateLimiter,
+  RateLimiter,
+)
+
+ENDPOINT = 'riders_get'
+
+
+# ===============================================================================
+def run(limiter: RateLimiter, calls: int) -> float:
+  """Issue calls check/wait/record cycles and return elapsed seconds."""
+  can_request = limiter.can_request
+  wait_time = limiter.wait_time
+  record_request = limiter.record_request
+
+  start = time.perf_counter()
+  for _ in range(calls):
+    if can_request(ENDPOINT):
+      record_request(ENDPOINT)
+    else:
+      wait_time(ENDPOINT)
+  return time.perf_counter() - start
+
+
+# ===============================================================================
+def measure(
+  name: str,
+  make_limiter: Callable[[], RateLimiter],
+  calls: int,
+) -> None:
+  """Print timing and retained limiter state for one limiter type."""
+  elapsed = run(make_limiter(), calls)
+
+  tracemalloc.start()
+  limiter = make_limiter()
+  before = tracemalloc.get_traced_memory()[0]
+  run(limiter, calls)
+  retained = tracemalloc.get_traced_memory()[0] - before
+  tracemalloc.stop()
+
+  per_call = elapsed / calls * 1e9
+  print(
+    f'{name:<16} {elapsed:8.3f}s  {per_call:8.1f} ns/call  '
+    f'{retained / 1024:10.1f} KiB retained',
+  )
+
+
+# ===============================================================================
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--calls', type=int, default=100000)
+  parser.add_argument(
+    '--limit',
+    type=int,
+    default=20000,
+    help='requests allowed per window (default: 20000)',
+  )
+  parser.add_argument(
+    '--window',
+    type=float,
+    default=60.0,
+    help='window in seconds (default: 60)',
+  )
+  args = parser.parse_args()
+
+  limits = {ENDPOINT: (args.limit, args.window)}
+  print(
+    f'{args.calls} calls, limit {args.limit} per {args.window:g}s '
+    f'on {ENDPOINT}',
+  )
+
+  def make_sliding() -> RateLimiter:
+    limiter = RateLimiter()
+    limiter.limits = limits
+    return limiter
+
+  def make_gcra() -> RateLimiter:
+    limiter = GCRARateLimiter(burst=args.limit)
+    limiter.limits = limits
+    return limiter
+
+  measure('RateLimiter', make_sliding, args.calls)
+  measure('GCRARateLimiter', make_gcra, args.calls)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,436 @@
+"""Two-tier response cache shared by zpdatafetch and zrdatafetch.
+
+ResponseCache keeps raw response bodies in an in-memory LRU bounded by
+entry count and total size, backed by an optional on-disk tier that
+survives restarts. Each key belongs to an endpoint family with its own
+time-to-live, and hits, misses and evictions are counted in CacheStats.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# ===============================================================================
+@dataclass
+class CacheEntry:
+  """A cached response body and its metadata.
+
+  Attributes:
+    key: Cache key (normally the request URL)
+    body: Raw response text
+    family: Endpoint family the key belongs to
+    stored_at: Time the entry was stored (seconds since the epoch)
+    expires_at: Time the entry becomes stale, or None if it never does
+    etag: ETag response header, used for If-None-Match revalidation
+    last_modified: Last-Modified response header, used for
+      If-Modified-Since revalidation
+  """
+
+  key: str
+  body: str
+  family: str
+  stored_at: float
+  expires_at: float | None
+  etag: str | None = None
+  last_modified: str | None = None
+
+  # -------------------------------------------------------------------------------
+  def is_fresh(self, now: float) -> bool:
+    """Return True if the entry has not expired at time now."""
+    return self.expires_at is None or now < self.expires_at
+
+
+# ===============================================================================
+@dataclass
+class CacheStats:
+  """Counters describing cache effectiveness.
+
+  Attributes:
+    hits: Lookups answered from the cache (either tier)
+    misses: Lookups that found no fresh entry
+    evictions: Entries dropped from memory to respect the size bounds
+    disk_hits: Hits answered from the disk tier
+    expired: Lookups that found only a stale entry
+    stores: Responses written to the cache
+    revalidated: Stale entries renewed by a 304 Not Modified response
+  """
+
+  hits: int = 0
+  misses: int = 0
+  evictions: int = 0
+  disk_hits: int = 0
+  expired: int = 0
+  stores: int = 0
+  revalidated: int = 0
+
+  # -------------------------------------------------------------------------------
+  @property
+  def hit_rate(self) -> float:
+    """Fraction of lookups that were hits (0.0 if none yet)."""
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+  # -------------------------------------------------------------------------------
+  def as_dict(self) -> dict[str, float]:
+    """Return the counters and hit rate as a plain dict."""
+    return {**asdict(self), 'hit_rate': self.hit_rate}
+
+
+# ===============================================================================
+class ResponseCache:
+  """In-memory LRU response cache with an optional disk tier.
+
+  Lookups check memory first, then disk; disk hits are promoted back into
+  memory. Entries evicted from memory stay on disk until they expire.
+
+  TTLs are looked up by endpoint family, as returned by family_for(). A TTL
+  of None never expires and a TTL of 0 disables caching for the family.
+  Subclasses override family_for() and normalize_key() to describe a
+  particular API.
+
+  Stale entries keep their ETag/Last-Modified validators, so a refresh can
+  be a conditional request; a 304 response renews the stored copy with
+  revalidate() instead of downloading it again.
+
+  Example:
+    cache = ResponseCache(max_entries=500, directory='~/.cache/zpdata')
+    body = cache.get(url)
+    if body is None:
+      response = client.get(url, headers=cache.conditional_headers(url))
+      if response.status_code == 304:
+        body = cache.revalidate(url)
+      else:
+        body = response.text
+        cache.set(url, body, etag=response.headers.get('ETag'))
+    print(cache.stats.as_dict())
+
+  Attributes:
+    max_entries: Maximum number of entries kept in memory
+    max_bytes: Maximum total body size kept in memory, or None
+    directory: Directory of the disk tier, or None for memory only
+    ttls: Mapping of endpoint family -> TTL in seconds
+    default_ttl: TTL for families missing from ttls
+    stats: Hit, miss and eviction counters
+  """
+
+  # -------------------------------------------------------------------------------
+  def __init__(
+    self,
+    max_entries: int = 256,
+    max_bytes: int | None = 64 * 1024 * 1024,
+    directory: str | Path | None = None,
+    ttls: dict[str, float | None] | None = None,
+    default_ttl: float | None = 300.0,
+    clock: Callable[[], float] = time.time,
+  ) -> None:
+    """Initialize the cache.
+
+    Args:
+      max_entries: Maximum entries kept in memory (default: 256)
+      max_bytes: Maximum total body characters kept in memory, or None for
+        no size bound (default: 64 MiB)
+      directory: Directory for the disk tier; created if missing. None
+        keeps the cache in memory only (default).
+      ttls: Per-family TTLs in seconds, merged over the class defaults
+      default_ttl: TTL for families without an entry in ttls (default: 300)
+      clock: Function returning the current time (default: time.time)
+
+    Raises:
+      ValueError: If max_entries is less than 1
+    """
+    if max_entries < 1:
+      raise ValueError('max_entries must be at least 1')
+
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self.directory = Path(directory).expanduser() if directory else None
+    self.ttls: dict[str, float | None] = {**self.default_ttls(), **(ttls or {})}
+    self.default_ttl = default_ttl
+    self.stats = CacheStats()
+    self._clock = clock
+    self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+    self._memory_bytes = 0
+
+    if self.directory is not None:
+      self.directory.mkdir(parents=True, exist_ok=True)
+
+  # -------------------------------------------------------------------------------
+  @classmethod
+  def default_ttls(cls) -> dict[str, float | None]:
+    """Per-family TTLs used when none are given (none for the base class)."""
+    return {}
+
+  # -------------------------------------------------------------------------------
+  def family_for(self, key: str) -> str:
+    """Return the endpoint family of a key ('default' for the base class)."""
+    return 'default'
+
+  # -------------------------------------------------------------------------------
+  def normalize_key(self, key: str) -> str:
+    """Return the canonical form of a key (unchanged for the base class)."""
+    return key
+
+  # -------------------------------------------------------------------------------
+  def ttl_for(self, family: str) -> float | None:
+    """Return the TTL in seconds for an endpoint family."""
+    return self.ttls.get(family, self.default_ttl)
+
+  # -------------------------------------------------------------------------------
+  def get(self, key: str) -> str | None:
+    """Return the cached body for key if a fresh entry exists.
+
+    Args:
+      key: Cache key, normally the request URL
+
+    Returns:
+      Cached response body, or None on a miss
+    """
+    key = self.normalize_key(key)
+    from_disk = key not in self._memory
+    entry = self._lookup(key)
+
+    if entry is not None and entry.is_fresh(self._clock()):
+      self.stats.hits += 1
+      if from_disk:
+        self.stats.disk_hits += 1
+      logger.debug(f'Cache hit: {key}')
+      return entry.body
+
+    if entry is not None:
+      self.stats.expired += 1
+    self.stats.misses += 1
+    logger.debug(f'Cache miss: {key}')
+    return None
+
+  # -------------------------------------------------------------------------------
+  def get_entry(self, key: str) -> CacheEntry | None:
+    """Return the entry for key even if stale, without touching stats.
+
+    Args:
+      key: Cache key, normally the request URL
+
+    Returns:
+      CacheEntry, or None if the key is not cached
+    """
+    return self._lookup(self.normalize_key(key))
+
+  # -------------------------------------------------------------------------------
+  def set(
+    self,
+    key: str,
+    body: str,
+    family: str | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+  ) -> None:
+    """Store a response body.
+
+    Bodies for families with a TTL of 0 are not stored.
+
+    Args:
+      key: Cache key, normally the request URL
+      body: Raw response text
+      family: Endpoint family, or None to derive it from the key
+      etag: ETag response header, if any
+      last_modified: Last-Modified response header, if any
+    """
+    key = self.normalize_key(key)
+    family = family or self.family_for(key)
+    ttl = self.ttl_for(family)
+    if ttl == 0:
+      return
+
+    now = self._clock()
+    entry = CacheEntry(
+      key=key,
+      body=body,
+      family=family,
+      stored_at=now,
+      expires_at=None if ttl is None else now + ttl,
+      etag=etag,
+      last_modified=last_modified,
+    )
+    self._remember(entry)
+    self._write_disk(entry)
+    self.stats.stores += 1
+    logger.debug(f'Cached {family} response: {key}')
+
+  # -------------------------------------------------------------------------------
+  def conditional_headers(self, key: str) -> dict[str, str]:
+    """Build revalidation headers from the validators stored for key.
+
+    Args:
+      key: Cache key, normally the request URL
+
+    Returns:
+      Dict with If-None-Match and/or If-Modified-Since, empty if the key
+      is not cached or has no validators
+    """
+    entry = self.get_entry(key)
+    headers: dict[str, str] = {}
+    if entry is None:
+      return headers
+    if entry.etag:
+      headers['If-None-Match'] = entry.etag
+    if entry.last_modified:
+      headers['If-Modified-Since'] = entry.last_modified
+    return headers
+
+  # -------------------------------------------------------------------------------
+  def revalidate(self, key: str) -> str | None:
+    """Renew a stale entry after the server answered 304 Not Modified.
+
+    The entry gets a fresh TTL from now and keeps its body and validators.
+
+    Args:
+      key: Cache key, normally the request URL
+
+    Returns:
+      The stored body, or None if the key is no longer cached
+    """
+    key = self.normalize_key(key)
+    entry = self._lookup(key)
+    if entry is None:
+      return None
+
+    ttl = self.ttl_for(entry.family)
+    now = self._clock()
+    entry.stored_at = now
+    entry.expires_at = None if ttl is None else now + ttl
+    self._write_disk(entry)
+    self.stats.revalidated += 1
+    logger.debug(f'Revalidated cached response: {key}')
+    return entry.body
+
+  # -------------------------------------------------------------------------------
+  def delete(self, key: str) -> None:
+    """Remove a key from both tiers."""
+    key = self.normalize_key(key)
+    entry = self._memory.pop(key, None)
+    if entry is not None:
+      self._memory_bytes -= len(entry.body)
+    path = self._path_for(key)
+    if path is not None:
+      path.unlink(missing_ok=True)
+
+  # -------------------------------------------------------------------------------
+  def clear(self) -> None:
+    """Remove every entry from both tiers and reset stats."""
+    self._memory.clear()
+    self._memory_bytes = 0
+    if self.directory is not None:
+      for path in self.directory.glob('*.json'):
+        path.unlink(missing_ok=True)
+    self.stats = CacheStats()
+
+  # -------------------------------------------------------------------------------
+  def purge_expired(self) -> int:
+    """Delete stale entries from both tiers.
+
+    Returns:
+      Number of entries removed
+    """
+    now = self._clock()
+    removed: set[str] = set()
+
+    for key in [k for k, e in self._memory.items() if not e.is_fresh(now)]:
+      self._memory_bytes -= len(self._memory.pop(key).body)
+      removed.add(key)
+
+    if self.directory is not None:
+      for path in self.directory.glob('*.json'):
+        entry = self._read_path(path)
+        if entry is None or not entry.is_fresh(now):
+          path.unlink(missing_ok=True)
+          removed.add(entry.key if entry is not None else str(path))
+
+    return len(removed)
+
+  # -------------------------------------------------------------------------------
+  def __len__(self) -> int:
+    """Number of entries held in memory."""
+    return len(self._memory)
+
+  # -------------------------------------------------------------------------------
+  def _lookup(self, key: str) -> CacheEntry | None:
+    """Find an entry in memory, then on disk, promoting disk hits."""
+    entry = self._memory.get(key)
+    if entry is not None:
+      self._memory.move_to_end(key)
+      return entry
+
+    entry = self._read_disk(key)
+    if entry is not None:
+      self._remember(entry)
+    return entry
+
+  # -------------------------------------------------------------------------------
+  def _remember(self, entry: CacheEntry) -> None:
+    """Insert an entry into memory and evict LRU entries over the bounds."""
+    old = self._memory.pop(entry.key, None)
+    if old is not None:
+      self._memory_bytes -= len(old.body)
+
+    self._memory[entry.key] = entry
+    self._memory_bytes += len(entry.body)
+
+    while len(self._memory) > 1 and (
+      len(self._memory) > self.max_entries
+      or (self.max_bytes is not None and self._memory_bytes > self.max_bytes)
+    ):
+      _, evicted = self._memory.popitem(last=False)
+      self._memory_bytes -= len(evicted.body)
+      self.stats.evictions += 1
+      logger.debug(f'Evicted from memory cache: {evicted.key}')
+
+  # -------------------------------------------------------------------------------
+  def _path_for(self, key: str) -> Path | None:
+    """Disk tier path for a key, or None without a disk tier."""
+    if self.directory is None:
+      return None
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return self.directory / f'{digest}.json'
+
+  # -------------------------------------------------------------------------------
+  def _read_disk(self, key: str) -> CacheEntry | None:
+    """Load the disk tier entry for key, if present and readable."""
+    path = self._path_for(key)
+    if path is None or not path.exists():
+      return None
+    entry = self._read_path(path)
+    return entry if entry is not None and entry.key == key else None
+
+  # -------------------------------------------------------------------------------
+  def _read_path(self, path: Path) -> CacheEntry | None:
+    """Load a CacheEntry from a disk tier file."""
+    try:
+      data: dict[str, Any] = json.loads(path.read_text(encoding='utf-8'))
+      return CacheEntry(**data)
+    except (OSError, ValueError, TypeError) as e:
+      logger.warning(f'Ignoring unreadable cache file {path}: {e}')
+      return None
+
+  # -------------------------------------------------------------------------------
+  def _write_disk(self, entry: CacheEntry) -> None:
+    """Write an entry to the disk tier atomically."""
+    path = self._path_for(entry.key)
+    if path is None:
+      return
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+      tmp.write_text(json.dumps(asdict(entry)), encoding='utf-8')
+      os.replace(tmp, path)
+    except OSError as e:
+      logger.warning(f'Could not write cache file {path}: {e}')
+      tmp.unlink(missing_ok=True)
+
@@ -46,7 +46,8 @@ def fetch_with_retry_sync(
     **kwargs: Additional arguments to pass to client.request()
 
   Returns:
-    httpx.Response: The successful response
+    httpx.Response: The successful response (or a 304 Not Modified
+      response to a conditional request)
 
   Raises:
     NetworkError: If all retries are exhausted
@@ -60,6 +61,9 @@ def fetch_with_retry_sync(
     try:
       logger.debug(f"Attempt {attempt + 1}/{max_retries}: {method} {url}")
       response = client.request(method, url, **kwargs)
+      if response.status_code == httpx.codes.NOT_MODIFIED:
+        # Conditional request - caller serves its cached copy
+        return response
       response.raise_for_status()
       return response
     except (httpx.ConnectError, httpx.TimeoutException) as e:
@@ -128,7 +132,8 @@ async def fetch_with_retry_async(
     **kwargs: Additional arguments to pass to client.request()
 
   Returns:
-    httpx.Response: The successful response
+    httpx.Response: The successful response (or a 304 Not Modified
+      response to a conditional request)
 
   Raises:
     NetworkError: If all retries are exhausted
@@ -142,6 +147,9 @@ async def fetch_with_retry_async(
     try:
       logger.debug(f"Attempt {attempt + 1}/{max_retries}: {method} {url}")
       response = await client.request(method, url, **kwargs)
+      if response.status_code == httpx.codes.NOT_MODIFIED:
+        # Conditional request - caller serves its cached copy
+        return response
       response.raise_for_status()
       return response
     except (httpx.ConnectError, httpx.TimeoutException) as e:
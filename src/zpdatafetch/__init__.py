@@ -1,5 +1,6 @@
 # Core imports
 from zpdatafetch.async_zp import AsyncZP
+from zpdatafetch.cache import ZPResponseCache, set_default_cache
 from zpdatafetch.config import Config
 from zpdatafetch.cyclist import Cyclist
 from zpdatafetch.logging_config import setup_logging
@@ -32,6 +33,9 @@ __all__ = [
   'Team',
   'League',
   'setup_logging',
+  # Response caching
+  'ZPResponseCache',
+  'set_default_cache',
   # Asynchronous API
   'AsyncZP',
   'AsyncCyclist',  # Alias for Cyclist (supports both sync and async)
@@ -9,6 +9,7 @@ from typing import Any
 import httpx
 from bs4 import BeautifulSoup
 
+from shared.cache import ResponseCache
 from shared.error_helpers import format_auth_error, format_network_error
 from shared.exceptions import (
   AuthenticationError,
@@ -16,6 +17,7 @@ from shared.exceptions import (
   NetworkError,
 )
 from shared.http_client import AsyncBaseHTTPClient, fetch_with_retry_async
+from zpdatafetch.cache import get_default_cache
 from zpdatafetch.config import Config
 from zpdatafetch.logging_config import get_logger
 
@@ -58,6 +60,7 @@ class AsyncZP(AsyncBaseHTTPClient):
     self,
     skip_credential_check: bool = False,
     shared_client: bool = False,
+    cache: ResponseCache | None = None,
   ) -> None:
     """Initialize the AsyncZP client with credentials from keyring.
 
@@ -65,6 +68,8 @@ class AsyncZP(AsyncBaseHTTPClient):
       skip_credential_check: Skip validation of credentials (used for testing)
       shared_client: Use a shared HTTP client for connection pooling (default: False).
         Useful when creating multiple AsyncZP instances for batch operations.
+      cache: Response cache for fetch_json(). Defaults to the cache set with
+        zpdatafetch.cache.set_default_cache(), if any.
 
     Raises:
       ConfigError: If credentials are not found in keyring
@@ -74,6 +79,7 @@ class AsyncZP(AsyncBaseHTTPClient):
     self.username: str = self.config.username
     self.password: str = self.config.password
     self.login_response: httpx.Response | None = None
+    self.cache = cache if cache is not None else get_default_cache()
 
     if not skip_credential_check and (not self.username or not self.password):
       raise ConfigError(
@@ -260,7 +266,9 @@ class AsyncZP(AsyncBaseHTTPClient):
     """Fetch JSON data from a Zwiftpower endpoint and return as raw string (async).
 
     Automatically logs in if not already authenticated. Retries on transient
-    network errors.
+    network errors. When a response cache is attached, fresh cached
+    responses are returned without a request, stale ones are revalidated
+    with If-None-Match/If-Modified-Since, and new responses are stored.
 
     Args:
       endpoint: Full URL of the JSON endpoint to fetch
@@ -272,6 +280,13 @@ class AsyncZP(AsyncBaseHTTPClient):
     Raises:
       NetworkError: If the HTTP request fails after retries
     """
+    headers: dict[str, str] = {}
+    if self.cache is not None:
+      cached = self.cache.get(endpoint)
+      if cached is not None:
+        return cached
+      headers = self.cache.conditional_headers(endpoint)
+
     try:
       logger.debug(f'Fetching JSON from: {endpoint}')
       if not self._client:
@@ -282,10 +297,25 @@ class AsyncZP(AsyncBaseHTTPClient):
         method='GET',
         max_retries=max_retries,
         logger=logger,
+        **({'headers': headers} if headers else {}),
       )
 
+      not_modified = pres.status_code == httpx.codes.NOT_MODIFIED
+      if not_modified and self.cache is not None:
+        cached = self.cache.revalidate(endpoint)
+        if cached is not None:
+          logger.debug(f'Not modified, using cached JSON for {endpoint}')
+          return cached
+
       res = pres.text
       logger.debug(f'Successfully fetched raw JSON from {endpoint}')
+      if self.cache is not None and res.strip():
+        self.cache.set(
+          endpoint,
+          res,
+          etag=pres.headers.get('ETag'),
+          last_modified=pres.headers.get('Last-Modified'),
+        )
       return res
     except NetworkError:
       raise
@@ -0,0 +1,106 @@
+"""Response cache for Zwiftpower JSON endpoints.
+
+Most cache3/*.json files change rarely (finished race results, profiles)
+or never. ZPResponseCache sorts Zwiftpower URLs into endpoint families
+with their own TTLs and strips the '_=' cache-busting parameter so that
+repeated requests for the same data share one entry.
+
+Attach a cache to a session with ZP(cache=...) / AsyncZP(cache=...), or
+install one for every new session with set_default_cache().
+"""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from shared.cache import ResponseCache
+
+# Default TTLs in seconds per endpoint family
+ZP_CACHE_TTLS: dict[str, float | None] = {
+  'profile': 3600.0,  # Rider profiles change after each race
+  'results': 600.0,  # Results settle shortly after a race ends
+  'signups': 300.0,  # Signups change until the race starts
+  'teams': 3600.0,  # Team rosters change rarely
+  'league': 3600.0,  # League standings update after each round
+  'primes': 600.0,
+  'sprints': 600.0,
+}
+
+_FAMILY_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+  (re.compile(r'/cache3/profile/'), 'profile'),
+  (re.compile(r'/cache3/results/\d+_signups\.json'), 'signups'),
+  (re.compile(r'/cache3/results/'), 'results'),
+  (re.compile(r'/cache3/teams/'), 'teams'),
+  (re.compile(r'/cache3/global/league_standings_'), 'league'),
+  (re.compile(r'/cache3/primes/|do=event_primes'), 'primes'),
+  (re.compile(r'do=event_sprints'), 'sprints'),
+)
+
+_default_cache: ResponseCache | None = None
+
+
+# ===============================================================================
+class ZPResponseCache(ResponseCache):
+  """ResponseCache that understands Zwiftpower endpoint URLs.
+
+  Families are 'profile', 'results', 'signups', 'teams', 'league',
+  'primes' and 'sprints'. URLs that match none of them fall into 'other',
+  which is not cached unless a TTL is given for it.
+
+  Example:
+    cache = ZPResponseCache(
+      directory='~/.cache/zpdatafetch',
+      ttls={'results': 86400, 'signups': 60},
+    )
+    with ZP(cache=cache) as zp:
+      result = Result()
+      result.set_zp_session(zp)
+      result.fetch(3590800)
+    print(cache.stats.as_dict())
+  """
+
+  # -------------------------------------------------------------------------------
+  @classmethod
+  def default_ttls(cls) -> dict[str, float | None]:
+    """Per-family TTLs from ZP_CACHE_TTLS, with 'other' disabled."""
+    return {**ZP_CACHE_TTLS, 'other': 0}
+
+  # -------------------------------------------------------------------------------
+  def family_for(self, key: str) -> str:
+    """Classify a Zwiftpower URL into an endpoint family."""
+    for pattern, family in _FAMILY_PATTERNS:
+      if pattern.search(key):
+        return family
+    return 'other'
+
+  # -------------------------------------------------------------------------------
+  def normalize_key(self, key: str) -> str:
+    """Drop the '_=' cache-busting query parameter from a URL."""
+    parts = urlsplit(key)
+    if not parts.query:
+      return key
+    query = [
+      (name, value)
+      for name, value in parse_qsl(parts.query, keep_blank_values=True)
+      if name != '_'
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+# ===============================================================================
+def set_default_cache(cache: ResponseCache | None) -> None:
+  """Install a cache used by every ZP/AsyncZP created without one.
+
+  This also covers the temporary sessions created by Cyclist, Result and
+  the other data classes when no session is set.
+
+  Args:
+    cache: Cache to use, or None to disable the default cache
+  """
+  global _default_cache
+  _default_cache = cache
+
+
+# ===============================================================================
+def get_default_cache() -> ResponseCache | None:
+  """Return the cache installed with set_default_cache(), if any."""
+  return _default_cache
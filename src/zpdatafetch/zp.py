@@ -3,9 +3,11 @@ from typing import Any
 import httpx
 from bs4 import BeautifulSoup
 
+from shared.cache import ResponseCache
 from shared.error_helpers import format_auth_error, format_network_error
 from shared.exceptions import AuthenticationError, ConfigError, NetworkError
 from shared.http_client import BaseHTTPClient, fetch_with_retry_sync
+from zpdatafetch.cache import get_default_cache
 from zpdatafetch.config import Config
 from zpdatafetch.logging_config import get_logger
 
@@ -41,6 +43,7 @@ class ZP(BaseHTTPClient):
     self,
     skip_credential_check: bool = False,
     shared_client: bool = False,
+    cache: ResponseCache | None = None,
   ) -> None:
     """Initialize the ZP client with credentials from keyring.
 
@@ -48,6 +51,8 @@ class ZP(BaseHTTPClient):
       skip_credential_check: Skip validation of credentials (used for testing)
       shared_client: Use a shared HTTP client for connection pooling (default: False).
         Useful when creating multiple ZP instances for batch operations.
+      cache: Response cache for fetch_json(). Defaults to the cache set with
+        zpdatafetch.cache.set_default_cache(), if any.
 
     Raises:
       ConfigError: If credentials are not found in keyring
@@ -57,6 +62,7 @@ class ZP(BaseHTTPClient):
     self.username: str = self.config.username
     self.password: str = self.config.password
     self.login_response: httpx.Response | None = None
+    self.cache = cache if cache is not None else get_default_cache()
 
     if not skip_credential_check and (not self.username or not self.password):
       raise ConfigError(
@@ -241,7 +247,9 @@ class ZP(BaseHTTPClient):
     """Fetch JSON data from a Zwiftpower endpoint and return as raw string.
 
     Automatically logs in if not already authenticated. Retries on transient
-    network errors.
+    network errors. When a response cache is attached, fresh cached
+    responses are returned without a request, stale ones are revalidated
+    with If-None-Match/If-Modified-Since, and new responses are stored.
 
     Args:
       endpoint: Full URL of the JSON endpoint to fetch
@@ -253,6 +261,13 @@ class ZP(BaseHTTPClient):
     Raises:
       NetworkError: If the HTTP request fails after retries
     """
+    headers: dict[str, str] = {}
+    if self.cache is not None:
+      cached = self.cache.get(endpoint)
+      if cached is not None:
+        return cached
+      headers = self.cache.conditional_headers(endpoint)
+
     try:
       logger.debug(f'Fetching JSON from: {endpoint}')
       if not self._client:
@@ -263,10 +278,25 @@ class ZP(BaseHTTPClient):
         method='GET',
         max_retries=max_retries,
         logger=logger,
+        **({'headers': headers} if headers else {}),
       )
 
+      not_modified = pres.status_code == httpx.codes.NOT_MODIFIED
+      if not_modified and self.cache is not None:
+        cached = self.cache.revalidate(endpoint)
+        if cached is not None:
+          logger.debug(f'Not modified, using cached JSON for {endpoint}')
+          return cached
+
       res = pres.text
       logger.debug(f'Successfully fetched raw JSON from {endpoint}')
+      if self.cache is not None and res.strip():
+        self.cache.set(
+          endpoint,
+          res,
+          etag=pres.headers.get('ETag'),
+          last_modified=pres.headers.get('Last-Modified'),
+        )
       return res
     except NetworkError:
       raise
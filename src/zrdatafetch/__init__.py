@@ -22,8 +22,11 @@ For command-line usage:
 """
 
 from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.cache import ZRResponseCache, set_default_cache
+from zrdatafetch.coalescer import RiderCoalescer
 from zrdatafetch.config import Config
 from zrdatafetch.logging_config import setup_logging
+from zrdatafetch.scheduler import FairScheduler
 from zrdatafetch.zr import ZR_obj
 from zrdatafetch.zrresult import ZRResult, ZRRiderResult
 from zrdatafetch.zrrider import ZRRider
@@ -47,6 +50,13 @@ __all__ = [
   'ZRRiderResult',
   'ZRTeam',
   'ZRTeamRider',
+  # Request coalescing
+  'RiderCoalescer',
+  # Multi-tenant scheduling
+  'FairScheduler',
+  # Response caching
+  'ZRResponseCache',
+  'set_default_cache',
   # Data classes (asynchronous) - Aliases for backwards compatibility
   'AsyncZRRider',  # Alias for ZRRider (supports both sync and async)
   'AsyncZRResult',  # Alias for ZRResult (supports both sync and async)
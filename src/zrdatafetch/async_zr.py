@@ -6,11 +6,13 @@ allowing for concurrent requests and better performance in async applications.
 
 from typing import Any
 
-import anyio
 import httpx
 
+from shared.cache import ResponseCache
 from shared.error_helpers import format_network_error
 from shared.exceptions import NetworkError
+from zrdatafetch.cache import get_default_cache
+from zrdatafetch.clock import SystemClock, VirtualClock
 from zrdatafetch.logging_config import get_logger
 from zrdatafetch.rate_limiter import RateLimiter
 
@@ -47,6 +49,9 @@ class AsyncZR_obj:
     self,
     shared_client: bool = False,
     premium: bool = False,
+    rate_limiter: RateLimiter | None = None,
+    clock: SystemClock | VirtualClock | None = None,
+    cache: ResponseCache | None = None,
   ) -> None:
     """Initialize the AsyncZR_obj client.
 
@@ -54,10 +59,25 @@ class AsyncZR_obj:
       shared_client: Use a shared HTTP client for connection pooling (default: False).
         Useful when creating multiple AsyncZR_obj instances for batch operations.
       premium: Use premium tier rate limits (default: False for standard tier).
+      rate_limiter: Rate limiter to use instead of a new RateLimiter, e.g. a
+        GCRARateLimiter or one shared between sessions. Its tier is used
+        as is and premium is ignored.
+      clock: Clock for rate limit waits and retry backoff. Defaults to the
+        rate limiter's clock, or SystemClock. Pass a VirtualClock to
+        simulate rate limited workloads offline.
+      cache: Response cache for GET requests. Defaults to the cache set
+        with zrdatafetch.cache.set_default_cache(), if any.
     """
     self._client: httpx.AsyncClient | None = None
     self._owns_client = not shared_client
-    self.rate_limiter = RateLimiter(tier='premium' if premium else 'standard')
+    if rate_limiter is None:
+      rate_limiter = RateLimiter(
+        tier='premium' if premium else 'standard',
+        clock=clock,
+      )
+    self.rate_limiter = rate_limiter
+    self.clock = clock if clock is not None else rate_limiter.clock
+    self.cache = cache if cache is not None else get_default_cache()
 
     if shared_client and AsyncZR_obj._shared_client is None:
       logger.debug('Creating shared async HTTP client for connection pooling')
@@ -139,6 +159,10 @@ class AsyncZR_obj:
       try:
         logger.debug(f'Attempt {attempt + 1}/{max_retries}: {method} {endpoint}')
         response = await self._client.request(method, endpoint, **kwargs)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+          # Conditional request - fetch_json serves the cached copy
+          self.rate_limiter.record_request(endpoint_type)
+          return response
         response.raise_for_status()
 
         # Record successful request for rate limiting
@@ -154,7 +178,7 @@ class AsyncZR_obj:
           f'Transient network error on attempt {attempt + 1}: {e}. '
           f'Retrying in {wait_time:.1f}s...',
         )
-        await anyio.sleep(wait_time)
+        await self.clock.sleep(wait_time)
 
       except httpx.HTTPStatusError as e:
         # Handle rate limit error (429)
@@ -175,7 +199,7 @@ class AsyncZR_obj:
             f'Server error ({e.response.status_code}) on attempt '
             f'{attempt + 1}: {e}. Retrying in {wait_time:.1f}s...',
           )
-          await anyio.sleep(wait_time)
+          await self.clock.sleep(wait_time)
         else:
           raise NetworkError(
             format_network_error(
@@ -195,7 +219,7 @@ class AsyncZR_obj:
           f'Request error on attempt {attempt + 1}: {e}. '
           f'Retrying in {wait_time:.1f}s...',
         )
-        await anyio.sleep(wait_time)
+        await self.clock.sleep(wait_time)
 
     if last_exception:
       logger.error(f'Max retries ({max_retries}) exhausted: {last_exception}')
@@ -221,6 +245,10 @@ class AsyncZR_obj:
     network errors. Returns the raw JSON response text without parsing.
     This allows the caller to store the unprocessed data and parse it later.
 
+    With a response cache attached, GET responses are served from the cache
+    while fresh and revalidated with If-None-Match/If-Modified-Since once
+    stale.
+
     Args:
       endpoint: API endpoint path (e.g., '/public/riders/123')
       method: HTTP method ('GET' or 'POST'). Default: 'GET'
@@ -249,6 +277,15 @@ class AsyncZR_obj:
       )
       data = json.loads(raw_json)  # Parse when needed
     """
+    cache = self.cache if method.upper() == 'GET' else None
+    if cache is not None:
+      cached = cache.get(endpoint)
+      if cached is not None:
+        return cached
+      validators = cache.conditional_headers(endpoint)
+      if validators:
+        kwargs['headers'] = {**(kwargs.get('headers') or {}), **validators}
+
     try:
       logger.debug(f'Fetching JSON from: {endpoint}')
       pres = await self._fetch_with_retry(
@@ -258,8 +295,21 @@ class AsyncZR_obj:
         **kwargs,
       )
 
+      if pres.status_code == httpx.codes.NOT_MODIFIED and cache is not None:
+        cached = cache.revalidate(endpoint)
+        if cached is not None:
+          logger.debug(f'Not modified, using cached JSON for {endpoint}')
+          return cached
+
       res = pres.text
       logger.debug(f'Successfully fetched raw JSON from {endpoint}')
+      if cache is not None and res.strip():
+        cache.set(
+          endpoint,
+          res,
+          etag=pres.headers.get('ETag'),
+          last_modified=pres.headers.get('Last-Modified'),
+        )
       return res
     except NetworkError:
       raise
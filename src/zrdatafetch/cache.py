@@ -0,0 +1,70 @@
+"""Response cache for Zwiftracing GET endpoints.
+
+ZRResponseCache sorts Zwiftracing API paths into the 'riders', 'results'
+and 'clubs' endpoint families, each with its own TTL. Only GET requests
+are cached; batch POST requests always go to the API.
+
+Attach a cache to a session with AsyncZR_obj(cache=...), or install one for
+every new session with set_default_cache().
+"""
+
+from shared.cache import ResponseCache
+
+# Default TTLs in seconds per endpoint family
+ZR_CACHE_TTLS: dict[str, float | None] = {
+  'riders': 300.0,  # Ratings change after each race
+  'results': 600.0,  # Results settle shortly after a race ends
+  'clubs': 600.0,  # Rosters and member ratings
+}
+
+_default_cache: ResponseCache | None = None
+
+
+# ===============================================================================
+class ZRResponseCache(ResponseCache):
+  """ResponseCache that understands Zwiftracing endpoint paths.
+
+  Example:
+    cache = ZRResponseCache(ttls={'clubs': 300})
+    async with AsyncZR_obj(cache=cache) as zr:
+      team = ZRTeam(team_id=456)
+      team.set_session(zr)
+      await team.afetch()
+  """
+
+  # -------------------------------------------------------------------------------
+  @classmethod
+  def default_ttls(cls) -> dict[str, float | None]:
+    """Per-family TTLs from ZR_CACHE_TTLS, with 'other' disabled."""
+    return {**ZR_CACHE_TTLS, 'other': 0}
+
+  # -------------------------------------------------------------------------------
+  def family_for(self, key: str) -> str:
+    """Classify a Zwiftracing endpoint path into an endpoint family."""
+    if '/riders' in key:
+      return 'riders'
+    if '/results' in key:
+      return 'results'
+    if '/clubs' in key:
+      return 'clubs'
+    return 'other'
+
+
+# ===============================================================================
+def set_default_cache(cache: ResponseCache | None) -> None:
+  """Install a cache used by every AsyncZR_obj created without one.
+
+  This also covers the temporary sessions created by ZRRider, ZRResult and
+  ZRTeam when no session is set.
+
+  Args:
+    cache: Cache to use, or None to disable the default cache
+  """
+  global _default_cache
+  _default_cache = cache
+
+
+# ===============================================================================
+def get_default_cache() -> ResponseCache | None:
+  """Return the cache installed with set_default_cache(), if any."""
+  return _default_cache
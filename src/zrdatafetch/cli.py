@@ -60,6 +60,12 @@ Module for fetching Zwiftracing data using the Zwiftracing API
     metavar='FILE',
     help='read IDs from file (one per line) for batch request (rider command only)',
   )
+  p.add_argument(
+    '--auto',
+    action='store_true',
+    help='choose between GET and batch POST based on remaining rate limit '
+    'quota (rider command only)',
+  )
   p.add_argument(
     '--premium',
     action='store_true',
@@ -98,18 +104,26 @@ Module for fetching Zwiftracing data using the Zwiftracing API
         return 1
 
       if args.noaction:
-        if args.batch or args.batch_file:
+        if args.auto:
+          print(
+            f'Would fetch {len(args.id)} riders using the fastest mix of '
+            f'GET and batch POST',
+          )
+        elif args.batch or args.batch_file:
           print(f'Would fetch {len(args.id)} riders using batch POST')
         else:
           format_noaction_output('rider', args.id, args.raw)
         return None
 
-      # Handle batch request
-      if args.batch or args.batch_file:
+      # Handle batch or strategy-selected request
+      if args.auto or args.batch or args.batch_file:
         try:
           # Convert IDs to integers for batch fetch
           rider_ids = [int(rid) for rid in args.id]
-          riders = ZRRider.fetch_batch(*rider_ids)
+          if args.auto:
+            riders = ZRRider.fetch_many(*rider_ids)
+          else:
+            riders = ZRRider.fetch_batch(*rider_ids)
           for zwift_id, rider in riders.items():
             if args.raw:
               print(rider.to_dict())
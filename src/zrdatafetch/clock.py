@@ -0,0 +1,180 @@
+"""Clocks used for rate limiting and retry backoff.
+
+RateLimiter, GCRARateLimiter and AsyncZR_obj read the time and sleep
+through a clock object. SystemClock (the default) uses the real clocks and
+anyio.sleep(). VirtualClock keeps its own time that only moves forward when
+every task is waiting on it, so schedules that take hours under the
+standard tier rate limits can be replayed offline in seconds.
+"""
+
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import anyio
+import anyio.lowlevel
+
+from zrdatafetch.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+# ===============================================================================
+class SystemClock:
+  """Real time clock: time.time(), time.monotonic() and anyio.sleep()."""
+
+  # -------------------------------------------------------------------------------
+  def time(self) -> float:
+    """Return wall clock time in seconds since the epoch."""
+    return time.time()
+
+  # -------------------------------------------------------------------------------
+  def monotonic(self) -> float:
+    """Return monotonic time in seconds."""
+    return time.monotonic()
+
+  # -------------------------------------------------------------------------------
+  async def sleep(self, seconds: float) -> None:
+    """Sleep for the given number of seconds."""
+    await anyio.sleep(seconds)
+
+
+# ===============================================================================
+class VirtualClock:
+  """Simulated clock for running rate limited workloads offline.
+
+  time() and monotonic() both return the virtual time. sleep() suspends the
+  caller until the virtual time reaches its deadline. Time moves forward
+  either explicitly with advance(), or automatically inside run(), which
+  jumps straight to the next deadline whenever all tasks are blocked.
+
+  Example:
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+
+    async def workload() -> None:
+      async with api.session() as zr:
+        await ZRRider.afetch_many(*rider_ids, zr=zr)
+
+    await clock.run(workload)
+    print(f'Finished after {clock.elapsed:.0f} simulated seconds')
+
+  Attributes:
+    start: Virtual time the clock started at
+  """
+
+  # Checkpoints given to woken tasks before checking whether all are blocked
+  _settle_checkpoints = 50
+
+  # -------------------------------------------------------------------------------
+  def __init__(self, start: float = 0.0) -> None:
+    """Initialize the clock.
+
+    Args:
+      start: Initial virtual time in seconds (default: 0.0)
+    """
+    self.start = start
+    self._now = start
+    self._sleepers: list[tuple[float, int, anyio.Event]] = []
+    self._counter = itertools.count()
+
+  # -------------------------------------------------------------------------------
+  @property
+  def elapsed(self) -> float:
+    """Virtual seconds passed since the clock started."""
+    return self._now - self.start
+
+  # -------------------------------------------------------------------------------
+  def time(self) -> float:
+    """Return the current virtual time."""
+    return self._now
+
+  # -------------------------------------------------------------------------------
+  def monotonic(self) -> float:
+    """Return the current virtual time."""
+    return self._now
+
+  # -------------------------------------------------------------------------------
+  async def sleep(self, seconds: float) -> None:
+    """Suspend the caller until the virtual time has advanced by seconds.
+
+    Args:
+      seconds: Virtual seconds to sleep (non-positive values only yield)
+    """
+    if seconds <= 0:
+      await anyio.lowlevel.checkpoint()
+      return
+
+    event = anyio.Event()
+    heapq.heappush(
+      self._sleepers,
+      (self._now + seconds, next(self._counter), event),
+    )
+    await event.wait()
+
+  # -------------------------------------------------------------------------------
+  def advance(self, seconds: float) -> None:
+    """Move the virtual time forward and wake sleepers that are due.
+
+    Args:
+      seconds: Virtual seconds to advance (must not be negative)
+
+    Raises:
+      ValueError: If seconds is negative
+    """
+    if seconds < 0:
+      raise ValueError('Cannot move a VirtualClock backwards')
+    self._jump_to(self._now + seconds)
+
+  # -------------------------------------------------------------------------------
+  def _jump_to(self, when: float) -> None:
+    """Set the virtual time to when and wake all sleepers due by then."""
+    self._now = max(self._now, when)
+    while self._sleepers and self._sleepers[0][0] <= self._now:
+      _, _, event = heapq.heappop(self._sleepers)
+      event.set()
+
+  # -------------------------------------------------------------------------------
+  async def run(self, func: Callable[..., Awaitable[T]], *args: object) -> T:
+    """Run func(*args), advancing virtual time whenever all tasks block.
+
+    Uses anyio.wait_all_tasks_blocked(), so any real I/O in the workload
+    counts as blocked and lets virtual time move on. Use an in-process
+    transport such as SimulatedZRAPI for repeatable results.
+
+    Args:
+      func: Async function to run
+      *args: Positional arguments for func
+
+    Returns:
+      The return value of func
+    """
+    result: list[T] = []
+    done = False
+
+    async def drive() -> None:
+      while not done:
+        for _ in range(self._settle_checkpoints):
+          await anyio.lowlevel.checkpoint()
+        await anyio.wait_all_tasks_blocked()
+        if done:
+          break
+        if self._sleepers:
+          self._jump_to(self._sleepers[0][0])
+        else:
+          # Blocked on something other than this clock - wait for it
+          await anyio.sleep(0.001)
+
+    async with anyio.create_task_group() as tg:
+      tg.start_soon(drive)
+      try:
+        result.append(await func(*args))
+      finally:
+        done = True
+
+    logger.debug(f'Virtual run finished after {self.elapsed:.1f}s')
+    return result[0]
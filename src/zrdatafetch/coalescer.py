@@ -0,0 +1,181 @@
+"""Coalescing of single-rider fetches into batch POST requests.
+
+Each ZRRider.afetch() call spends one 'riders_get' request (5 per minute on
+the standard tier), while a single POST to /public/riders can return up to
+1000 riders. RiderCoalescer collects single-rider requests that arrive
+within a short window and resolves them all with one afetch_batch() call.
+"""
+
+from typing import TYPE_CHECKING
+
+import anyio
+
+from shared.exceptions import NetworkError
+from zrdatafetch.logging_config import get_logger
+
+if TYPE_CHECKING:
+  from zrdatafetch.async_zr import AsyncZR_obj
+  from zrdatafetch.zrrider import ZRRider
+
+logger = get_logger(__name__)
+
+
+# ===============================================================================
+class _PendingBatch:
+  """A batch of rider IDs waiting to be sent as one POST request.
+
+  Attributes:
+    ids: Rider IDs in arrival order (dict used as an ordered set)
+    full: Event set when the batch reaches its maximum size
+    done: Event set once the batch request has completed or failed
+    results: Mapping of rider ID to fetched ZRRider
+    error: Exception raised by the batch request, if any
+  """
+
+  def __init__(self) -> None:
+    self.ids: dict[int, None] = {}
+    self.full = anyio.Event()
+    self.done = anyio.Event()
+    self.results: dict[int, ZRRider] = {}
+    self.error: BaseException | None = None
+
+
+# ===============================================================================
+class RiderCoalescer:
+  """Merge concurrent single-rider fetches into batch POST requests.
+
+  The first request for a given epoch opens a batch and waits for `window`
+  seconds. Requests for the same epoch that arrive in the meantime join the
+  batch. When the window closes (or the batch reaches `max_batch` IDs), a
+  single ZRRider.afetch_batch() call is made and the results are handed
+  back to every waiting caller.
+
+  Coalescing is opt-in. Attach a coalescer to a rider with
+  ZRRider.set_coalescer(), or call fetch() directly:
+
+    async with AsyncZR_obj() as zr:
+      coalescer = RiderCoalescer(zr)
+      async with anyio.create_task_group() as tg:
+        for zwift_id in (123456, 789012, 345678):
+          rider = ZRRider(zwift_id=zwift_id)
+          rider.set_coalescer(coalescer)
+          tg.start_soon(rider.afetch)
+
+  Attributes:
+    window: Seconds to wait for more requests before sending a batch
+    max_batch: Maximum rider IDs per batch (API limit is 1000)
+  """
+
+  # -----------------------------------------------------------------------
+  def __init__(
+    self,
+    zr: 'AsyncZR_obj | None' = None,
+    window: float = 0.1,
+    max_batch: int = 1000,
+  ) -> None:
+    """Initialize the coalescer.
+
+    Args:
+      zr: AsyncZR_obj session used for batch requests. If None, each batch
+        creates a temporary session.
+      window: Seconds to collect requests before sending (default: 0.1)
+      max_batch: Maximum IDs per batch, 1-1000 (default: 1000)
+
+    Raises:
+      ValueError: If max_batch is outside 1-1000 or window is negative
+    """
+    if not 1 <= max_batch <= 1000:
+      raise ValueError('max_batch must be between 1 and 1000')
+    if window < 0:
+      raise ValueError('window must not be negative')
+
+    self._zr = zr
+    self.window = window
+    self.max_batch = max_batch
+    self._pending: dict[int | None, _PendingBatch] = {}
+
+  # -----------------------------------------------------------------------
+  async def fetch(self, zwift_id: int, epoch: int | None = None) -> 'ZRRider':
+    """Fetch a single rider, coalesced with other concurrent requests.
+
+    Args:
+      zwift_id: Rider's Zwift ID
+      epoch: Unix timestamp for historical data (None or -1 for current)
+
+    Returns:
+      ZRRider populated from the batch response
+
+    Raises:
+      NetworkError: If the batch request fails or the rider is missing
+        from the batch response
+      ConfigError: If authorization is not configured
+    """
+    if epoch is not None and epoch < 0:
+      epoch = None
+
+    batch = self._pending.get(epoch)
+    leader = batch is None
+    if batch is None:
+      batch = _PendingBatch()
+      self._pending[epoch] = batch
+
+    batch.ids[zwift_id] = None
+    if len(batch.ids) >= self.max_batch:
+      # Batch is full - send it now, later requests start a new one
+      self._close(epoch, batch)
+      batch.full.set()
+
+    if leader:
+      await self._run(epoch, batch)
+    else:
+      await batch.done.wait()
+
+    if batch.error is not None:
+      raise batch.error
+
+    rider = batch.results.get(zwift_id)
+    if rider is None:
+      raise NetworkError(
+        f'Rider {zwift_id} not found in coalesced batch response',
+      )
+    return rider
+
+  # -----------------------------------------------------------------------
+  def _close(self, epoch: int | None, batch: _PendingBatch) -> None:
+    """Stop a batch from accepting further requests."""
+    if self._pending.get(epoch) is batch:
+      del self._pending[epoch]
+
+  # -----------------------------------------------------------------------
+  async def _run(self, epoch: int | None, batch: _PendingBatch) -> None:
+    """Wait for the window to close, then send the batch request.
+
+    Runs in the task of the first caller. Any failure, including
+    cancellation of that task, is propagated to every waiting caller.
+    """
+    from zrdatafetch.zrrider import ZRRider
+
+    try:
+      with anyio.move_on_after(self.window):
+        await batch.full.wait()
+      self._close(epoch, batch)
+
+      ids = list(batch.ids)
+      logger.debug(
+        f'Sending coalesced batch of {len(ids)} riders, epoch={epoch}',
+      )
+      batch.results = await ZRRider.afetch_batch(
+        *ids,
+        epoch=epoch,
+        zr=self._zr,
+      )
+    except BaseException as e:
+      self._close(epoch, batch)
+      batch.error = (
+        e
+        if isinstance(e, Exception)
+        else NetworkError('Coalesced batch request was cancelled')
+      )
+      raise
+    finally:
+      batch.done.set()
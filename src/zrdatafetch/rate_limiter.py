@@ -1,15 +1,16 @@
 """Rate limiting for ZwiftRanking API.
 
 Implements sliding window rate limiting for different API endpoints with
-support for standard and premium tier rate limits.
+support for standard and premium tier rate limits. GCRARateLimiter is a
+constant-time, constant-memory alternative based on the generic cell rate
+algorithm.
 """
 
-import time
+import math
 from collections import deque
 from typing import Literal
 
-import anyio
-
+from zrdatafetch.clock import SystemClock, VirtualClock
 from zrdatafetch.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -48,12 +49,18 @@ class RateLimiter:
   }
 
   # -------------------------------------------------------------------------------
-  def __init__(self, tier: Literal['standard', 'premium'] = 'standard') -> None:
+  def __init__(
+    self,
+    tier: Literal['standard', 'premium'] = 'standard',
+    clock: SystemClock | VirtualClock | None = None,
+  ) -> None:
     """Initialize rate limiter with specified tier.
 
     Args:
       tier: 'standard' (default) or 'premium' rate limits
+      clock: Clock used for timestamps and waiting (default: SystemClock)
     """
+    self.clock = clock if clock is not None else SystemClock()
     self.tier = tier
     self.limits = self.PREMIUM_LIMITS if tier == 'premium' else self.STANDARD_LIMITS
     self.history: dict[str, deque] = {
@@ -76,11 +83,11 @@ class RateLimiter:
       return True
 
     max_requests, window = self.limits[endpoint]
-    now = time.time()
+    now = self.clock.time()
 
     # Remove old requests outside window
     history = self.history[endpoint]
-    while history and now - history[0] > window:
+    while history and now - history[0] >= window:
       history.popleft()
 
     can_request = len(history) < max_requests
@@ -113,7 +120,7 @@ class RateLimiter:
 
     # Time until oldest request expires
     oldest = history[0]
-    wait = window - (time.time() - oldest)
+    wait = window - (self.clock.time() - oldest)
     return max(0.0, wait)
 
   # -------------------------------------------------------------------------------
@@ -124,7 +131,7 @@ class RateLimiter:
       endpoint: Endpoint key ('clubs', 'results', 'riders_get', 'riders_post')
     """
     if endpoint in self.history:
-      self.history[endpoint].append(time.time())
+      self.history[endpoint].append(self.clock.time())
       logger.debug(f'Recorded request for {endpoint}')
 
   # -------------------------------------------------------------------------------
@@ -143,7 +150,7 @@ class RateLimiter:
         f'Rate limit reached for {endpoint}, waiting {wait:.1f}s '
         f'({self.tier} tier)',
       )
-      await anyio.sleep(wait)
+      await self.clock.sleep(wait)
       logger.debug(f'Resuming requests for {endpoint}')
 
   # -------------------------------------------------------------------------------
@@ -154,13 +161,13 @@ class RateLimiter:
       Dict with endpoint status including requests used and remaining
     """
     status = {'tier': self.tier, 'endpoints': {}}
-    now = time.time()
+    now = self.clock.time()
 
     for endpoint, (max_requests, window) in self.limits.items():
       history = self.history[endpoint]
 
       # Remove old requests
-      while history and now - history[0] > window:
+      while history and now - history[0] >= window:
         history.popleft()
 
       used = len(history)
@@ -208,3 +215,145 @@ class RateLimiter:
     if '/riders' in endpoint:
       return 'riders_post' if method.upper() == 'POST' else 'riders_get'
     return 'unknown'
+
+
+# ===============================================================================
+class GCRARateLimiter(RateLimiter):
+  """Rate limiter using the generic cell rate algorithm (GCRA).
+
+  GCRA is equivalent to a token bucket but stores a single float per
+  endpoint: the theoretical arrival time (TAT) of the next request. A limit
+  of N requests per W seconds becomes one request every W / N seconds (the
+  emission interval), with up to `burst` requests allowed back to back.
+  can_request(), wait_time() and record_request() are O(1) and use the
+  monotonic clock, so they are unaffected by wall clock adjustments.
+
+  The default burst of 1 spaces requests evenly and never exceeds N
+  requests in any W second window. Larger bursts let idle clients send
+  several requests at once, but can then send up to N + burst - 1 requests
+  within one window, which the API's sliding window may reject.
+
+  Drop-in replacement for RateLimiter:
+
+    zr = AsyncZR_obj(rate_limiter=GCRARateLimiter())
+
+  Attributes:
+    tier: 'standard' or 'premium' tier level
+    burst: Maximum requests allowed back to back
+  """
+
+  # -------------------------------------------------------------------------------
+  def __init__(
+    self,
+    tier: Literal['standard', 'premium'] = 'standard',
+    burst: int = 1,
+    clock: SystemClock | VirtualClock | None = None,
+  ) -> None:
+    """Initialize rate limiter with specified tier.
+
+    Args:
+      tier: 'standard' (default) or 'premium' rate limits
+      burst: Requests allowed back to back (default: 1)
+      clock: Clock used for timestamps and waiting (default: SystemClock)
+
+    Raises:
+      ValueError: If burst is less than 1
+    """
+    if burst < 1:
+      raise ValueError('burst must be at least 1')
+
+    self.clock = clock if clock is not None else SystemClock()
+    self.tier = tier
+    self.limits = self.PREMIUM_LIMITS if tier == 'premium' else self.STANDARD_LIMITS
+    self.burst = burst
+    self._tat: dict[str, float] = {}
+    logger.debug(f'Initialized GCRARateLimiter with {tier} tier, burst={burst}')
+
+  # -------------------------------------------------------------------------------
+  def _interval(self, endpoint: str) -> float:
+    """Seconds between requests at the sustained rate for an endpoint."""
+    max_requests, window = self.limits[endpoint]
+    return window / max_requests
+
+  # -------------------------------------------------------------------------------
+  def can_request(self, endpoint: str) -> bool:
+    """Check if request is allowed within rate limit.
+
+    Args:
+      endpoint: Endpoint key ('clubs', 'results', 'riders_get', 'riders_post')
+
+    Returns:
+      True if request is allowed, False if rate limit reached
+    """
+    return self.wait_time(endpoint) == 0.0
+
+  # -------------------------------------------------------------------------------
+  def wait_time(self, endpoint: str) -> float:
+    """Calculate seconds to wait before next request is allowed.
+
+    Args:
+      endpoint: Endpoint key ('clubs', 'results', 'riders_get', 'riders_post')
+
+    Returns:
+      Number of seconds to wait (0.0 if request is allowed now)
+    """
+    if endpoint not in self.limits:
+      return 0.0
+
+    tat = self._tat.get(endpoint)
+    if tat is None:
+      return 0.0
+
+    tolerance = (self.burst - 1) * self._interval(endpoint)
+    return max(0.0, tat - tolerance - self.clock.monotonic())
+
+  # -------------------------------------------------------------------------------
+  def record_request(self, endpoint: str) -> None:
+    """Record that a request was made to an endpoint.
+
+    Args:
+      endpoint: Endpoint key ('clubs', 'results', 'riders_get', 'riders_post')
+    """
+    if endpoint not in self.limits:
+      return
+
+    now = self.clock.monotonic()
+    tat = self._tat.get(endpoint, now)
+    self._tat[endpoint] = max(tat, now) + self._interval(endpoint)
+    logger.debug(f'Recorded request for {endpoint}')
+
+  # -------------------------------------------------------------------------------
+  def get_status(self) -> dict:
+    """Get current rate limit status for all endpoints.
+
+    'used' is the number of emission intervals still outstanding and
+    'remaining' is how many requests may be sent back to back right now.
+    'reset_in_seconds' is the time until one more request is released
+    after the remaining ones are spent.
+
+    Returns:
+      Dict with endpoint status including requests used and remaining
+    """
+    status = {'tier': self.tier, 'endpoints': {}}
+    now = self.clock.monotonic()
+
+    for endpoint, (max_requests, window) in self.limits.items():
+      interval = window / max_requests
+      tolerance = (self.burst - 1) * interval
+      tat = max(self._tat.get(endpoint, now), now)
+
+      backlog = tat - now
+      used = min(max_requests, math.ceil(backlog / interval - 1e-9))
+      allowed = math.floor((now + tolerance - tat) / interval + 1e-9) + 1
+      remaining = max(0, min(self.burst, max_requests, allowed))
+      reset_in = tat + remaining * interval - tolerance - now
+
+      status['endpoints'][endpoint] = {
+        'used': used,
+        'limit': max_requests,
+        'remaining': remaining,
+        'window_seconds': window,
+        'reset_in_seconds': max(0.0, reset_in),
+      }
+
+    return status
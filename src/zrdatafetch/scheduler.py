@@ -0,0 +1,365 @@
+"""Multi-tenant fair scheduling of Zwiftracing API requests.
+
+Services that fetch data for several clubs hold one authorization token
+(and tier) per club. FairScheduler keeps a request queue per tenant and a
+rate limiter per token, and dispatches with weighted fair queuing (WFQ), so
+a long crawl for one tenant cannot starve short interactive lookups for
+the others - even when they share a token.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import anyio
+import httpx
+from anyio.abc import TaskGroup
+
+from shared.exceptions import NetworkError
+from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.clock import SystemClock, VirtualClock
+from zrdatafetch.logging_config import get_logger
+from zrdatafetch.rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+
+# ===============================================================================
+@dataclass(eq=False)
+class _QueuedRequest:
+  """A request waiting in a tenant queue.
+
+  Attributes:
+    endpoint: API endpoint path
+    method: HTTP method
+    endpoint_type: Rate limit endpoint key
+    tag: WFQ virtual finish time; lowest tag is dispatched first
+    kwargs: Extra arguments for AsyncZR_obj.fetch_json()
+    done: Event set once the request completed or failed
+    result: Raw JSON response text
+    error: Exception raised by the request, if any
+  """
+
+  endpoint: str
+  method: str
+  endpoint_type: str
+  tag: float
+  kwargs: dict[str, Any]
+  done: anyio.Event = field(default_factory=anyio.Event)
+  result: str = ''
+  error: BaseException | None = None
+
+
+# ===============================================================================
+@dataclass(eq=False)
+class _Tenant:
+  """Per-tenant queue and WFQ state.
+
+  Attributes:
+    name: Tenant name
+    authorization: Zwiftracing authorization token
+    weight: Share of dispatch capacity relative to other tenants
+    queue: Requests waiting to be sent, in arrival order
+    finish: Virtual finish time of the tenant's last queued request
+    served: Number of requests dispatched for this tenant
+  """
+
+  name: str
+  authorization: str
+  weight: float
+  queue: deque[_QueuedRequest] = field(default_factory=deque)
+  finish: float = 0.0
+  served: int = 0
+
+
+# ===============================================================================
+class FairScheduler:
+  """Weighted fair queuing of API requests across tenants and tokens.
+
+  Each tenant has its own FIFO queue and a weight. Each authorization token
+  has its own AsyncZR_obj session and rate limiter, shared by all tenants
+  that use the token. Whenever a token's limit allows another request, the
+  queued request with the lowest virtual finish time is sent, so tenants
+  receive capacity in proportion to their weights and a tenant with an
+  empty queue does not accumulate credit.
+
+  Example:
+    async with FairScheduler() as scheduler:
+      scheduler.add_tenant('club-a', token_a, tier='premium')
+      scheduler.add_tenant('club-b', token_b, weight=2)
+      raw = await scheduler.fetch_json('club-b', '/public/riders/12345')
+
+  Attributes:
+    clock: Clock used for rate limit waits
+  """
+
+  # -------------------------------------------------------------------------------
+  def __init__(
+    self,
+    client: httpx.AsyncClient | None = None,
+    clock: SystemClock | VirtualClock | None = None,
+  ) -> None:
+    """Initialize the scheduler.
+
+    Args:
+      client: HTTP client shared by all token sessions. If None, one is
+        created when the scheduler starts and closed when it stops.
+      clock: Clock for rate limiting (default: SystemClock)
+    """
+    self.clock = clock if clock is not None else SystemClock()
+    self._client = client
+    self._owns_client = client is None
+    self._tenants: dict[str, _Tenant] = {}
+    self._sessions: dict[str, AsyncZR_obj] = {}
+    self._inflight: dict[tuple[str, str], int] = {}
+    self._virtual_time = 0.0
+    self._wake: anyio.Event | None = None
+    self._ready: set[str] = set()
+    self._tg: TaskGroup | None = None
+
+  # -------------------------------------------------------------------------------
+  def add_tenant(
+    self,
+    name: str,
+    authorization: str,
+    tier: Literal['standard', 'premium'] = 'standard',
+    weight: float = 1.0,
+    rate_limiter: RateLimiter | None = None,
+  ) -> None:
+    """Register a tenant.
+
+    Tenants that share an authorization token share its rate limiter; the
+    first tenant registered for a token decides its tier.
+
+    Args:
+      name: Unique tenant name
+      authorization: Zwiftracing authorization token for the tenant
+      tier: Rate limit tier of the token (default: 'standard')
+      weight: Relative share of capacity, greater than 0 (default: 1.0)
+      rate_limiter: Limiter for a new token instead of RateLimiter(tier)
+
+    Raises:
+      ValueError: If the name is taken or weight is not positive
+    """
+    if name in self._tenants:
+      raise ValueError(f'Tenant already registered: {name}')
+    if weight <= 0:
+      raise ValueError('weight must be greater than 0')
+
+    if authorization not in self._sessions:
+      if rate_limiter is None:
+        rate_limiter = RateLimiter(tier=tier, clock=self.clock)
+      self._sessions[authorization] = AsyncZR_obj(
+        rate_limiter=rate_limiter,
+        clock=self.clock,
+      )
+
+    self._tenants[name] = _Tenant(name, authorization, weight)
+    logger.debug(f'Added tenant {name} ({tier} tier, weight={weight})')
+
+  # -------------------------------------------------------------------------------
+  async def fetch_json(
+    self,
+    tenant: str,
+    endpoint: str,
+    method: str = 'GET',
+    cost: float = 1.0,
+    **kwargs: Any,
+  ) -> str:
+    """Queue a request for a tenant and wait for its response.
+
+    Args:
+      tenant: Name of a registered tenant
+      endpoint: API endpoint path (e.g., '/public/riders/123')
+      method: HTTP method ('GET' or 'POST'). Default: 'GET'
+      cost: Relative size of the request for fair queuing (default: 1.0)
+      **kwargs: Additional arguments passed to AsyncZR_obj.fetch_json()
+
+    Returns:
+      Raw JSON response as string
+
+    Raises:
+      ValueError: If the tenant is not registered
+      RuntimeError: If the scheduler is not running
+      NetworkError: If the request fails or the scheduler stops first
+    """
+    if tenant not in self._tenants:
+      raise ValueError(f'Unknown tenant: {tenant}')
+    if self._tg is None:
+      raise RuntimeError('FairScheduler is not running, use "async with"')
+
+    state = self._tenants[tenant]
+    start = max(self._virtual_time, state.finish)
+    state.finish = start + cost / state.weight
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    headers.setdefault('Authorization', state.authorization)
+    request = _QueuedRequest(
+      endpoint=endpoint,
+      method=method,
+      endpoint_type=RateLimiter.get_endpoint_type(method, endpoint),
+      tag=state.finish,
+      kwargs={'headers': headers, **kwargs},
+    )
+    state.queue.append(request)
+    self._wake.set()
+
+    await request.done.wait()
+    if request.error is not None:
+      raise request.error
+    return request.result
+
+  # -------------------------------------------------------------------------------
+  def get_status(self) -> dict[str, dict[str, Any]]:
+    """Get queue status for every tenant.
+
+    Returns:
+      Dict of tenant name -> {'queued', 'served', 'weight'}
+    """
+    return {
+      name: {
+        'queued': len(tenant.queue),
+        'served': tenant.served,
+        'weight': tenant.weight,
+      }
+      for name, tenant in self._tenants.items()
+    }
+
+  # -------------------------------------------------------------------------------
+  def _available(self, tenant: _Tenant, endpoint_type: str) -> int:
+    """Requests the tenant's token may send now for an endpoint type."""
+    limiter = self._sessions[tenant.authorization].rate_limiter
+    if endpoint_type not in limiter.limits:
+      return 1
+    remaining = limiter.get_status()['endpoints'][endpoint_type]['remaining']
+    inflight = self._inflight.get((tenant.authorization, endpoint_type), 0)
+    return remaining - inflight
+
+  # -------------------------------------------------------------------------------
+  def _select(self) -> tuple[_Tenant | None, float | None]:
+    """Pick the tenant whose queue head should be sent next.
+
+    Returns:
+      (tenant, None) if a request can be sent now, otherwise
+      (None, seconds until a rate limit frees up, or None to wait for an
+      in-flight request or a new arrival)
+    """
+    best: _Tenant | None = None
+    wait: float | None = None
+
+    for tenant in self._tenants.values():
+      if not tenant.queue:
+        continue
+      head = tenant.queue[0]
+      if self._available(tenant, head.endpoint_type) > 0:
+        if best is None or head.tag < best.queue[0].tag:
+          best = tenant
+        continue
+
+      limiter = self._sessions[tenant.authorization].rate_limiter
+      key = (tenant.authorization, head.endpoint_type)
+      if not self._inflight.get(key):
+        ready_in = limiter.wait_time(head.endpoint_type)
+        wait = ready_in if wait is None else min(wait, ready_in)
+
+    return best, None if best else wait
+
+  # -------------------------------------------------------------------------------
+  async def _dispatch(self) -> None:
+    """Send queued requests as rate limits allow, lowest tag first."""
+    while True:
+      self._wake = anyio.Event()
+      tenant, wait = self._select()
+
+      if tenant is not None:
+        request = tenant.queue.popleft()
+        tenant.served += 1
+        self._virtual_time = request.tag
+        key = (tenant.authorization, request.endpoint_type)
+        self._inflight[key] = self._inflight.get(key, 0) + 1
+        self._tg.start_soon(self._send, tenant, request, key)
+        continue
+
+      if wait is not None:
+        self._tg.start_soon(self._wake_after, self._wake, wait)
+      await self._wake.wait()
+
+  # -------------------------------------------------------------------------------
+  async def _wake_after(self, event: anyio.Event, seconds: float) -> None:
+    """Set event after seconds on the scheduler's clock."""
+    await self.clock.sleep(seconds)
+    event.set()
+
+  # -------------------------------------------------------------------------------
+  async def _send(
+    self,
+    tenant: _Tenant,
+    request: _QueuedRequest,
+    key: tuple[str, str],
+  ) -> None:
+    """Send one request through the token's session."""
+    session = self._sessions[tenant.authorization]
+    try:
+      if tenant.authorization not in self._ready:
+        self._ready.add(tenant.authorization)
+        await session.init_client(self._client)
+      logger.debug(
+        f'Dispatching {request.method} {request.endpoint} for {tenant.name}',
+      )
+      request.result = await session.fetch_json(
+        request.endpoint,
+        method=request.method,
+        **request.kwargs,
+      )
+    except BaseException as e:
+      request.error = (
+        e
+        if isinstance(e, Exception)
+        else NetworkError(f'Request to {request.endpoint} was cancelled')
+      )
+      if not isinstance(e, Exception):
+        raise
+    finally:
+      self._inflight[key] -= 1
+      request.done.set()
+      self._wake.set()
+
+  # -------------------------------------------------------------------------------
+  async def __aenter__(self) -> 'FairScheduler':
+    """Start the dispatcher."""
+    if self._client is None:
+      self._client = httpx.AsyncClient(
+        base_url=AsyncZR_obj._base_url,
+        timeout=30.0,
+        follow_redirects=True,
+        verify=True,
+      )
+    self._wake = anyio.Event()
+    self._tg = anyio.create_task_group()
+    await self._tg.__aenter__()
+    self._tg.start_soon(self._dispatch)
+    return self
+
+  # -------------------------------------------------------------------------------
+  async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
+    """Stop the dispatcher and fail any requests still queued.
+
+    Returns:
+      False to propagate any exceptions that occurred
+    """
+    for tenant in self._tenants.values():
+      while tenant.queue:
+        request = tenant.queue.popleft()
+        request.error = NetworkError(
+          f'FairScheduler stopped before {request.endpoint} was sent',
+        )
+        request.done.set()
+
+    tg, self._tg = self._tg, None
+    tg.cancel_scope.cancel()
+    await tg.__aexit__(exc_type, exc_val, exc_tb)
+
+    if self._owns_client and self._client is not None:
+      await self._client.aclose()
+      self._client = None
+    return False
@@ -0,0 +1,260 @@
+"""Local stand-in for the Zwiftracing API, for offline rate limit simulation.
+
+SimulatedZRAPI answers rider, club and result requests in-process through
+an httpx.MockTransport and enforces the same per-endpoint rate limits as
+the real API, measured on a VirtualClock. Combined with VirtualClock.run(),
+a workload that would take hours against the real API under the standard
+tier limits finishes in seconds, and the request log shows exactly when
+each request was sent and whether it was throttled.
+"""
+
+import json
+import re
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import httpx
+
+from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.clock import VirtualClock
+from zrdatafetch.logging_config import get_logger
+from zrdatafetch.rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+_RIDER_PATH = re.compile(r'^/api/public/riders/(\d+)(?:/(\d+))?$')
+_BATCH_PATH = re.compile(r'^/api/public/riders(?:/(\d+))?$')
+_CLUB_PATH = re.compile(r'^/api/public/clubs/(\d+)(?:/(\d+))?$')
+_RESULT_PATH = re.compile(r'^/api/public/results/(\d+)$')
+
+
+# ===============================================================================
+@dataclass(frozen=True)
+class SimulatedRequest:
+  """One request received by SimulatedZRAPI.
+
+  Attributes:
+    time: Virtual time the request arrived
+    method: HTTP method
+    path: Request path
+    endpoint: Rate limit endpoint key ('riders_get', 'clubs', ...)
+    status: HTTP status code returned
+  """
+
+  time: float
+  method: str
+  path: str
+  endpoint: str
+  status: int
+
+
+# ===============================================================================
+class SimulatedZRAPI:
+  """In-process Zwiftracing API with rate limits on a virtual clock.
+
+  Every known rider, club and race ID exists; responses are small synthetic
+  payloads. Limits are tracked per Authorization header, and requests over
+  the tier's limit get a 429 response, just like the real API.
+
+  Example:
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+
+    async def workload() -> None:
+      async with api.session() as zr:
+        for zwift_id in rider_ids:
+          rider = ZRRider(zwift_id=zwift_id)
+          rider.set_session(zr)
+          await rider.afetch()
+
+    await clock.run(workload)
+    print(clock.elapsed, api.count(status=429))
+
+  Attributes:
+    clock: VirtualClock used for rate limiting
+    tier: Rate limit tier to enforce
+    club_size: Number of riders returned for each club
+    log: Every request received, in arrival order
+  """
+
+  # -------------------------------------------------------------------------------
+  def __init__(
+    self,
+    clock: VirtualClock,
+    tier: Literal['standard', 'premium'] = 'standard',
+    club_size: int = 3,
+  ) -> None:
+    """Initialize the stand-in API.
+
+    Args:
+      clock: VirtualClock used for rate limiting
+      tier: 'standard' (default) or 'premium' rate limits to enforce
+      club_size: Number of riders returned for each club (default: 3)
+    """
+    self.clock = clock
+    self.tier = tier
+    self.club_size = club_size
+    if tier == 'premium':
+      self.limits = RateLimiter.PREMIUM_LIMITS
+    else:
+      self.limits = RateLimiter.STANDARD_LIMITS
+    self._history: dict[tuple[str, str], deque] = {}
+    self.log: list[SimulatedRequest] = []
+
+  # -------------------------------------------------------------------------------
+  @property
+  def transport(self) -> httpx.MockTransport:
+    """httpx transport that routes requests to this stand-in."""
+    return httpx.MockTransport(self.handle)
+
+  # -------------------------------------------------------------------------------
+  def client(self) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient connected to this stand-in."""
+    return httpx.AsyncClient(
+      base_url=AsyncZR_obj._base_url,
+      transport=self.transport,
+    )
+
+  # -------------------------------------------------------------------------------
+  @asynccontextmanager
+  async def session(
+    self,
+    rate_limiter: RateLimiter | None = None,
+  ) -> AsyncIterator[AsyncZR_obj]:
+    """Open an AsyncZR_obj session that talks to this stand-in.
+
+    Args:
+      rate_limiter: Client-side rate limiter to use. Defaults to a
+        RateLimiter for the same tier on the stand-in's clock.
+
+    Yields:
+      AsyncZR_obj using the stand-in's transport and clock
+    """
+    if rate_limiter is None:
+      rate_limiter = RateLimiter(tier=self.tier, clock=self.clock)
+    zr = AsyncZR_obj(rate_limiter=rate_limiter, clock=self.clock)
+    await zr.init_client(self.client())
+    async with zr:
+      yield zr
+
+  # -------------------------------------------------------------------------------
+  def count(
+    self,
+    endpoint: str | None = None,
+    status: int | None = None,
+  ) -> int:
+    """Count logged requests, optionally filtered by endpoint and status.
+
+    Args:
+      endpoint: Rate limit endpoint key to match
+      status: HTTP status code to match
+
+    Returns:
+      Number of matching requests
+    """
+    return sum(
+      1
+      for request in self.log
+      if (endpoint is None or request.endpoint == endpoint)
+      and (status is None or request.status == status)
+    )
+
+  # -------------------------------------------------------------------------------
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    """Answer one request, enforcing rate limits.
+
+    Args:
+      request: Incoming httpx request
+
+    Returns:
+      Response with a synthetic payload, 429 if over the rate limit, or
+      404 for unknown paths
+    """
+    path = request.url.path
+    method = request.method
+    endpoint = RateLimiter.get_endpoint_type(method, path)
+
+    token = request.headers.get('Authorization', '')
+    if self._over_limit(token, endpoint):
+      status, payload = 429, {'message': 'Rate limit exceeded'}
+    else:
+      status, payload = self._route(method, path, request)
+
+    self.log.append(
+      SimulatedRequest(self.clock.time(), method, path, endpoint, status),
+    )
+    logger.debug(f'Simulated {method} {path} -> {status}')
+    return httpx.Response(status, json=payload)
+
+  # -------------------------------------------------------------------------------
+  def _over_limit(self, token: str, endpoint: str) -> bool:
+    """Record a request and report whether it exceeds the sliding window."""
+    if endpoint not in self.limits:
+      return False
+
+    max_requests, window = self.limits[endpoint]
+    now = self.clock.time()
+    history = self._history.setdefault((token, endpoint), deque())
+    while history and now - history[0] >= window:
+      history.popleft()
+
+    if len(history) >= max_requests:
+      return True
+    history.append(now)
+    return False
+
+  # -------------------------------------------------------------------------------
+  def _route(
+    self,
+    method: str,
+    path: str,
+    request: httpx.Request,
+  ) -> tuple[int, Any]:
+    """Build the status code and payload for an accepted request."""
+    if method == 'GET' and (match := _RIDER_PATH.match(path)):
+      return 200, self.rider_payload(int(match.group(1)))
+
+    if method == 'POST' and _BATCH_PATH.match(path):
+      ids = json.loads(request.content or b'[]')
+      return 200, [self.rider_payload(int(zwift_id)) for zwift_id in ids]
+
+    if method == 'GET' and (match := _CLUB_PATH.match(path)):
+      team_id = int(match.group(1))
+      first = team_id * 1000
+      return 200, {
+        'clubId': team_id,
+        'name': f'Simulated Team {team_id}',
+        'riders': [
+          self.rider_payload(first + i) for i in range(self.club_size)
+        ],
+      }
+
+    if method == 'GET' and (match := _RESULT_PATH.match(path)):
+      return 200, {
+        'eventId': match.group(1),
+        'time': int(self.clock.time()),
+        'title': f'Simulated Race {match.group(1)}',
+        'type': 'Race',
+        'results': [],
+      }
+
+    return 404, {'message': 'Not found'}
+
+  # -------------------------------------------------------------------------------
+  @staticmethod
+  def rider_payload(zwift_id: int) -> dict[str, Any]:
+    """Build the synthetic rider record returned for zwift_id."""
+    return {
+      'riderId': zwift_id,
+      'name': f'Simulated Rider {zwift_id}',
+      'gender': 'M',
+      'power': {'compoundScore': 100.0},
+      'race': {
+        'current': {'rating': 1500.0, 'mixed': {'category': 'B'}},
+        'max30': {'rating': 1600.0, 'mixed': {'category': 'B'}},
+        'max90': {'rating': 1700.0, 'mixed': {'category': 'A'}},
+      },
+    }
@@ -0,0 +1,114 @@
+"""Quota-aware selection between rider GET and batch POST requests.
+
+Fetching N riders can use N 'riders_get' requests, ceil(N / 1000)
+'riders_post' requests, or a mix of both. Which finishes sooner depends on
+N and on the quota left in each rate limit window, as reported by
+RateLimiter.get_status(). plan_rider_fetch() picks the split with the
+shortest estimated wait.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+# Maximum rider IDs accepted by one POST /public/riders request
+MAX_BATCH_SIZE = 1000
+
+
+# ===============================================================================
+@dataclass(frozen=True)
+class RiderFetchPlan:
+  """How to split a set of rider IDs between GET and POST requests.
+
+  Attributes:
+    get_count: Number of riders to fetch with individual GET requests
+    post_count: Number of riders to fetch with batch POST requests
+    post_batches: Number of POST requests needed for post_count riders
+    estimated_wait: Estimated seconds spent waiting on rate limits
+  """
+
+  get_count: int
+  post_count: int
+  post_batches: int
+  estimated_wait: float
+
+
+# ===============================================================================
+def estimate_wait(endpoint_status: dict[str, Any] | None, requests: int) -> float:
+  """Estimate seconds of rate limit waiting needed to issue requests.
+
+  Uses one entry of RateLimiter.get_status()['endpoints']. Requests beyond
+  the remaining quota are assumed to be released a full limit at a time,
+  once per window, starting when the oldest recorded request expires.
+
+  Args:
+    endpoint_status: Status dict for one endpoint, or None if unlimited
+    requests: Number of requests to issue
+
+  Returns:
+    Estimated wait in seconds (0.0 if the quota covers all requests)
+  """
+  if requests <= 0 or endpoint_status is None:
+    return 0.0
+
+  remaining = endpoint_status['remaining']
+  if requests <= remaining:
+    return 0.0
+
+  limit = max(1, endpoint_status['limit'])
+  window = endpoint_status['window_seconds']
+  reset_in = endpoint_status['reset_in_seconds']
+  first_release = reset_in if reset_in > 0 else window
+  waves = math.ceil((requests - remaining) / limit)
+  return first_release + (waves - 1) * window
+
+
+# ===============================================================================
+def plan_rider_fetch(count: int, status: dict[str, Any]) -> RiderFetchPlan:
+  """Choose the fastest mix of GET and POST requests for count riders.
+
+  Candidate splits are all-GET, all-POST, spending the remaining GET quota
+  first, and using GETs for the remainder that would otherwise need one
+  extra POST. The split with the shortest estimated wait wins. Ties go to
+  the split using fewer POST requests (the scarcer quota), then fewer
+  requests overall.
+
+  Args:
+    count: Number of rider IDs to fetch
+    status: Output of RateLimiter.get_status()
+
+  Returns:
+    RiderFetchPlan describing the chosen split
+
+  Example:
+    plan = plan_rider_fetch(3, zr.rate_limiter.get_status())
+    # Full standard quota: RiderFetchPlan(get_count=3, post_count=0, ...)
+  """
+  if count <= 0:
+    return RiderFetchPlan(0, 0, 0, 0.0)
+
+  endpoints = status.get('endpoints', {})
+  get_status = endpoints.get('riders_get')
+  post_status = endpoints.get('riders_post')
+  get_remaining = get_status['remaining'] if get_status else count
+
+  candidates = {
+    0,
+    count,
+    min(count, get_remaining),
+    count % MAX_BATCH_SIZE,
+  }
+
+  best: tuple[tuple[float, int, int], RiderFetchPlan] | None = None
+  for get_count in sorted(candidates):
+    post_count = count - get_count
+    post_batches = math.ceil(post_count / MAX_BATCH_SIZE)
+    wait = max(
+      estimate_wait(get_status, get_count),
+      estimate_wait(post_status, post_batches),
+    )
+    key = (wait, post_batches, get_count + post_batches)
+    if best is None or key < best[0]:
+      best = (key, RiderFetchPlan(get_count, post_count, post_batches, wait))
+
+  return best[1]
@@ -6,16 +6,22 @@ rating data from the Zwiftracing API.
 
 import asyncio
 import json
-from dataclasses import asdict, dataclass, field
-from typing import Any
+from dataclasses import asdict, dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+import anyio
 
 from shared.exceptions import ConfigError, NetworkError
 from shared.json_helpers import parse_json_safe
 from zrdatafetch.async_zr import AsyncZR_obj
 from zrdatafetch.config import Config
 from zrdatafetch.logging_config import get_logger
+from zrdatafetch.strategy import MAX_BATCH_SIZE, plan_rider_fetch
 from zrdatafetch.zr import ZR_obj
 
+if TYPE_CHECKING:
+  from zrdatafetch.coalescer import RiderCoalescer
+
 logger = get_logger(__name__)
 
 
@@ -97,6 +103,7 @@ class ZRRider(ZR_obj):
   _verbose: bool = field(default=False, init=False, repr=False)
   _zr: AsyncZR_obj | None = field(default=None, init=False, repr=False)
   _zr_sync: ZR_obj | None = field(default=None, init=False, repr=False)
+  _coalescer: 'RiderCoalescer | None' = field(default=None, init=False, repr=False)
 
   # -----------------------------------------------------------------------
   def set_session(self, zr: AsyncZR_obj) -> None:
@@ -118,6 +125,31 @@ class ZRRider(ZR_obj):
     """
     self._zr_sync = zr
 
+  # -----------------------------------------------------------------------
+  def set_coalescer(self, coalescer: 'RiderCoalescer | None') -> None:
+    """Route afetch() through a RiderCoalescer.
+
+    Concurrent afetch() calls sharing the same coalescer are merged into
+    batch POST requests instead of one GET request each.
+
+    Args:
+      coalescer: RiderCoalescer to use, or None to fetch individually
+    """
+    self._coalescer = coalescer
+
+  # -----------------------------------------------------------------------
+  def _copy_from(self, other: 'ZRRider') -> None:
+    """Copy parsed rider data from another ZRRider instance.
+
+    Args:
+      other: Rider whose public attributes, _raw and _rider are copied
+    """
+    for f in fields(self):
+      if not f.name.startswith('_'):
+        setattr(self, f.name, getattr(other, f.name))
+    self._raw = other._raw
+    self._rider = other._rider
+
   # -----------------------------------------------------------------------
   async def _get_or_create_session(self) -> tuple[AsyncZR_obj, bool]:
     """Get or create an async session for fetching.
@@ -163,6 +195,17 @@ class ZRRider(ZR_obj):
       logger.warning('No zwift_id provided for fetch')
       return
 
+    if self._coalescer is not None:
+      epoch = self.epoch
+      rider = await self._coalescer.fetch(self.zwift_id, epoch=epoch)
+      self._copy_from(rider)
+      self.epoch = epoch
+      logger.info(
+        f'Successfully fetched rider {self.name} (zwift_id={self.zwift_id}) '
+        f'via coalesced batch',
+      )
+      return
+
     # Get authorization from config
     config = Config()
     config.load()
@@ -299,6 +342,8 @@ class ZRRider(ZR_obj):
       return
 
     try:
+      # Batch responses identify each rider by riderId
+      self.zwift_id = self._rider.get('riderId', self.zwift_id)
       self.name = self._rider.get('name', 'Nobody')
       self.gender = self._rider.get('gender', 'M')
 
@@ -576,6 +621,121 @@ class ZRRider(ZR_obj):
       if owns_session and zr:
         await zr.close()
 
+  # -----------------------------------------------------------------------
+  @staticmethod
+  async def afetch_many(
+    *zwift_ids: int,
+    epoch: int | None = None,
+    zr: AsyncZR_obj | None = None,
+  ) -> dict[int, 'ZRRider']:
+    """Fetch any number of riders using the fastest mix of GET and POST.
+
+    Inspects the session's RateLimiter.get_status() and uses
+    plan_rider_fetch() to decide how many riders to fetch with individual
+    GET requests and how many with batch POST requests. For example, a
+    handful of IDs are fetched with GETs when the POST window is used up,
+    while large sets go through POST batches of up to 1000 IDs. GET and
+    POST requests run concurrently.
+
+    Args:
+      *zwift_ids: Rider IDs to fetch (any number, duplicates ignored)
+      epoch: Unix timestamp for historical data (None for current)
+      zr: Optional AsyncZR_obj session. Its rate limiter drives the plan.
+        If not provided, creates a temporary session.
+
+    Returns:
+      Dictionary mapping rider ID to ZRRider instance with parsed data
+
+    Raises:
+      NetworkError: If an API request fails
+      ConfigError: If authorization is not configured
+
+    Example:
+      async with AsyncZR_obj() as zr:
+        riders = await ZRRider.afetch_many(*team_ids, zr=zr)
+    """
+    ids = list(dict.fromkeys(zwift_ids))
+    if not ids:
+      logger.warning('No rider IDs provided for fetch')
+      return {}
+
+    if not zr:
+      zr = AsyncZR_obj()
+      await zr.init_client()
+      owns_session = True
+    else:
+      owns_session = False
+
+    try:
+      plan = plan_rider_fetch(len(ids), zr.rate_limiter.get_status())
+      logger.info(
+        f'Fetching {len(ids)} riders: {plan.get_count} by GET, '
+        f'{plan.post_count} by POST in {plan.post_batches} batch(es), '
+        f'estimated rate limit wait {plan.estimated_wait:.1f}s',
+      )
+      get_ids = ids[: plan.get_count]
+      post_ids = ids[plan.get_count :]
+      results: dict[int, ZRRider] = {}
+
+      async def fetch_gets() -> None:
+        for zwift_id in get_ids:
+          rider = ZRRider(zwift_id=zwift_id)
+          rider.set_session(zr)
+          await rider.afetch(epoch=epoch)
+          results[zwift_id] = rider
+
+      async def fetch_posts() -> None:
+        for start in range(0, len(post_ids), MAX_BATCH_SIZE):
+          chunk = post_ids[start : start + MAX_BATCH_SIZE]
+          results.update(
+            await ZRRider.afetch_batch(*chunk, epoch=epoch, zr=zr),
+          )
+
+      async with anyio.create_task_group() as tg:
+        tg.start_soon(fetch_gets)
+        tg.start_soon(fetch_posts)
+
+      return results
+
+    finally:
+      if owns_session and zr:
+        await zr.close()
+
+  # -----------------------------------------------------------------------
+  @staticmethod
+  def fetch_many(
+    *zwift_ids: int,
+    epoch: int | None = None,
+  ) -> dict[int, 'ZRRider']:
+    """Fetch any number of riders using the fastest mix of GET and POST.
+
+    Synchronous interface to afetch_many(). Uses a temporary session, so
+    the plan starts from a fresh rate limit window.
+
+    Args:
+      *zwift_ids: Rider IDs to fetch (any number, duplicates ignored)
+      epoch: Unix timestamp for historical data (None for current)
+
+    Returns:
+      Dictionary mapping rider ID to ZRRider instance with parsed data
+
+    Raises:
+      NetworkError: If an API request fails
+      ConfigError: If authorization is not configured
+      RuntimeError: If called from async context (use afetch_many() instead)
+    """
+    try:
+      asyncio.get_running_loop()
+      raise RuntimeError(
+        'fetch_many() called from async context. Use afetch_many() instead, '
+        'or call fetch_many() from synchronous code.',
+      )
+    except RuntimeError as e:
+      if 'fetch_many() called from async context' in str(e):
+        raise
+      # No running loop - safe to use asyncio.run()
+      return asyncio.run(ZRRider.afetch_many(*zwift_ids, epoch=epoch))
+
   # -----------------------------------------------------------------------
   def to_dict(self) -> dict[str, Any]:
     """Return dictionary representation excluding private attributes.
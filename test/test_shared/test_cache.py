@@ -0,0 +1,172 @@
+"""Tests for shared.cache module."""
+
+import pytest
+
+from shared.cache import ResponseCache
+
+
+class FakeClock:
+  """Manually advanced clock for TTL tests."""
+
+  def __init__(self) -> None:
+    self.now = 1000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def clock():
+  return FakeClock()
+
+
+class TestResponseCacheMemory:
+  """Tests for the in-memory LRU tier."""
+
+  def test_miss_then_hit(self, clock):
+    """Test a stored body is returned and counted as a hit."""
+    cache = ResponseCache(clock=clock)
+    assert cache.get('url') is None
+    cache.set('url', 'body')
+    assert cache.get('url') == 'body'
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+  def test_ttl_expiry(self, clock):
+    """Test entries expire after their family TTL."""
+    cache = ResponseCache(default_ttl=60, clock=clock)
+    cache.set('url', 'body')
+    clock.now += 59
+    assert cache.get('url') == 'body'
+    clock.now += 1
+    assert cache.get('url') is None
+    assert cache.stats.expired == 1
+    assert cache.get_entry('url').body == 'body'
+
+  def test_none_ttl_never_expires(self, clock):
+    """Test a TTL of None keeps entries forever."""
+    cache = ResponseCache(default_ttl=None, clock=clock)
+    cache.set('url', 'body')
+    clock.now += 10**9
+    assert cache.get('url') == 'body'
+
+  def test_zero_ttl_disables_family(self, clock):
+    """Test a TTL of 0 skips storing."""
+    cache = ResponseCache(ttls={'default': 0}, clock=clock)
+    cache.set('url', 'body')
+    assert cache.get('url') is None
+    assert cache.stats.stores == 0
+
+  def test_lru_eviction_by_count(self, clock):
+    """Test the least recently used entry is evicted first."""
+    cache = ResponseCache(max_entries=2, clock=clock)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    cache.get('a')
+    cache.set('c', '3')
+    assert cache.get('b') is None
+    assert cache.get('a') == '1'
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+  def test_eviction_by_size(self, clock):
+    """Test the total body size bound."""
+    cache = ResponseCache(max_bytes=10, clock=clock)
+    cache.set('a', 'x' * 6)
+    cache.set('b', 'y' * 6)
+    assert cache.get('a') is None
+    assert cache.get('b') == 'y' * 6
+
+  def test_delete_and_clear(self, clock):
+    """Test explicit removal."""
+    cache = ResponseCache(clock=clock)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    cache.delete('a')
+    assert cache.get('a') is None
+    cache.clear()
+    assert cache.get('b') is None
+    assert len(cache) == 0
+
+  def test_rejects_zero_entries(self):
+    """Test max_entries must be positive."""
+    with pytest.raises(ValueError, match='max_entries'):
+      ResponseCache(max_entries=0)
+
+
+class TestResponseCacheDisk:
+  """Tests for the disk tier."""
+
+  def test_survives_restart(self, clock, tmp_path):
+    """Test a new cache instance reads entries written by another."""
+    ResponseCache(directory=tmp_path, clock=clock).set('url', 'body')
+    cache = ResponseCache(directory=tmp_path, clock=clock)
+    assert cache.get('url') == 'body'
+    assert cache.stats.disk_hits == 1
+
+  def test_evicted_entries_stay_on_disk(self, clock, tmp_path):
+    """Test memory evictions fall back to the disk tier."""
+    cache = ResponseCache(max_entries=1, directory=tmp_path, clock=clock)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    assert cache.stats.evictions == 1
+    assert cache.get('a') == '1'
+    assert cache.stats.disk_hits == 1
+
+  def test_purge_expired(self, clock, tmp_path):
+    """Test stale entries are removed from both tiers."""
+    cache = ResponseCache(default_ttl=10, directory=tmp_path, clock=clock)
+    cache.set('a', '1')
+    clock.now += 11
+    assert cache.purge_expired() == 1
+    assert list(tmp_path.glob('*.json')) == []
+
+  def test_unreadable_file_is_a_miss(self, clock, tmp_path):
+    """Test corrupt cache files are ignored."""
+    cache = ResponseCache(directory=tmp_path, clock=clock)
+    cache.set('url', 'body')
+    for path in tmp_path.glob('*.json'):
+      path.write_text('not json')
+    assert ResponseCache(directory=tmp_path, clock=clock).get('url') is None
+
+
+class TestResponseCacheRevalidation:
+  """Tests for ETag/Last-Modified validators."""
+
+  def test_conditional_headers(self, clock):
+    """Test validators are turned into request headers."""
+    cache = ResponseCache(clock=clock)
+    assert cache.conditional_headers('url') == {}
+    cache.set('url', 'body', etag='"abc"', last_modified='Mon, 01 Jan 2024')
+    assert cache.conditional_headers('url') == {
+      'If-None-Match': '"abc"',
+      'If-Modified-Since': 'Mon, 01 Jan 2024',
+    }
+
+  def test_no_validators(self, clock):
+    """Test entries without validators give no headers."""
+    cache = ResponseCache(clock=clock)
+    cache.set('url', 'body')
+    assert cache.conditional_headers('url') == {}
+
+  def test_revalidate_renews_ttl(self, clock):
+    """Test a 304 makes a stale entry fresh again."""
+    cache = ResponseCache(default_ttl=60, clock=clock)
+    cache.set('url', 'body', etag='"abc"')
+    clock.now += 61
+    assert cache.get('url') is None
+    assert cache.revalidate('url') == 'body'
+    assert cache.get('url') == 'body'
+    assert cache.get_entry('url').etag == '"abc"'
+    assert cache.stats.revalidated == 1
+
+  def test_revalidate_missing_key(self, clock):
+    """Test revalidating an unknown key returns None."""
+    assert ResponseCache(clock=clock).revalidate('url') is None
+
+  def test_validators_persist_on_disk(self, clock, tmp_path):
+    """Test validators survive a restart."""
+    ResponseCache(directory=tmp_path, clock=clock).set('url', 'b', etag='"e"')
+    cache = ResponseCache(directory=tmp_path, clock=clock)
+    assert cache.conditional_headers('url') == {'If-None-Match': '"e"'}
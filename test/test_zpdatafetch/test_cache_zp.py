@@ -0,0 +1,149 @@
+"""Tests for the Zwiftpower response cache."""
+
+import httpx
+import pytest
+
+from zpdatafetch import ZP, AsyncZP
+from zpdatafetch.cache import (
+  ZPResponseCache,
+  get_default_cache,
+  set_default_cache,
+)
+
+
+@pytest.fixture
+def counting_handler():
+  """MockTransport handler that counts requests per path."""
+  calls: dict[str, int] = {}
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    calls[request.url.path] = calls.get(request.url.path, 0) + 1
+    return httpx.Response(200, text='{"data": []}')
+
+  handler.calls = calls
+  return handler
+
+
+class TestZPResponseCacheFamilies:
+  """Tests for URL classification and key normalization."""
+
+  @pytest.mark.parametrize(
+    ('url', 'family'),
+    [
+      ('https://zwiftpower.com/cache3/profile/123_all.json', 'profile'),
+      ('https://zwiftpower.com/cache3/results/99_view.json', 'results'),
+      ('https://zwiftpower.com/cache3/results/99_signups.json', 'signups'),
+      ('https://zwiftpower.com/cache3/teams/5_riders.json', 'teams'),
+      (
+        'https://zwiftpower.com/cache3/global/league_standings_7.json',
+        'league',
+      ),
+      ('https://zwiftpower.com/api3.php?do=event_primes&zid=1', 'primes'),
+      ('https://zwiftpower.com/api3.php?do=event_sprints&zid=1', 'sprints'),
+      ('https://zwiftpower.com/events.php', 'other'),
+    ],
+  )
+  def test_family_for(self, url, family):
+    assert ZPResponseCache().family_for(url) == family
+
+  def test_strips_cache_buster(self):
+    cache = ZPResponseCache()
+    url = 'https://zwiftpower.com/api3.php?do=event_primes&zid=1&_=1700000000'
+    assert cache.normalize_key(url) == (
+      'https://zwiftpower.com/api3.php?do=event_primes&zid=1'
+    )
+
+  def test_other_family_not_cached(self):
+    cache = ZPResponseCache()
+    cache.set('https://zwiftpower.com/events.php', 'body')
+    assert cache.get('https://zwiftpower.com/events.php') is None
+
+  def test_ttl_override(self):
+    cache = ZPResponseCache(ttls={'results': None})
+    assert cache.ttl_for('results') is None
+    assert cache.ttl_for('profile') == 3600.0
+
+
+class TestZPFetchJsonCache:
+  """Tests for caching inside ZP.fetch_json and AsyncZP.fetch_json."""
+
+  def test_sync_second_fetch_is_cached(self, counting_handler):
+    cache = ZPResponseCache()
+    zp = ZP(skip_credential_check=True, cache=cache)
+    zp.init_client(
+      httpx.Client(transport=httpx.MockTransport(counting_handler)),
+    )
+    url = 'https://zwiftpower.com/cache3/results/99_view.json'
+
+    assert zp.fetch_json(url) == zp.fetch_json(url)
+    assert counting_handler.calls == {'/cache3/results/99_view.json': 1}
+    assert cache.stats.hits == 1
+
+  @pytest.mark.anyio
+  async def test_async_second_fetch_is_cached(self, counting_handler):
+    cache = ZPResponseCache()
+    zp = AsyncZP(skip_credential_check=True, cache=cache)
+    await zp.init_client(
+      httpx.AsyncClient(transport=httpx.MockTransport(counting_handler)),
+    )
+    url = 'https://zwiftpower.com/cache3/profile/1_all.json'
+
+    await zp.fetch_json(url)
+    await zp.fetch_json(url)
+    await zp.close()
+    assert counting_handler.calls == {'/cache3/profile/1_all.json': 1}
+
+  def test_default_cache(self):
+    cache = ZPResponseCache()
+    set_default_cache(cache)
+    try:
+      assert get_default_cache() is cache
+      assert ZP(skip_credential_check=True).cache is cache
+    finally:
+      set_default_cache(None)
+    assert ZP(skip_credential_check=True).cache is None
+
+
+class TestZPConditionalRefresh:
+  """Tests for ETag revalidation in ZP.fetch_json."""
+
+  def test_stale_entry_revalidated_with_304(self):
+    now = [1000.0]
+    cache = ZPResponseCache(clock=lambda: now[0])
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+      seen_headers.append(request.headers.get('If-None-Match'))
+      if request.headers.get('If-None-Match') == '"v1"':
+        return httpx.Response(304)
+      return httpx.Response(200, text='{"data": [1]}', headers={'ETag': '"v1"'})
+
+    zp = ZP(skip_credential_check=True, cache=cache)
+    zp.init_client(httpx.Client(transport=httpx.MockTransport(handler)))
+    url = 'https://zwiftpower.com/cache3/global/league_standings_7.json'
+
+    assert zp.fetch_json(url) == '{"data": [1]}'
+    now[0] += 3601
+    assert zp.fetch_json(url) == '{"data": [1]}'
+    assert seen_headers == [None, '"v1"']
+    assert cache.stats.revalidated == 1
+
+  @pytest.mark.anyio
+  async def test_async_changed_entry_replaced(self):
+    now = [1000.0]
+    cache = ZPResponseCache(clock=lambda: now[0])
+    bodies = iter(['{"v": 1}', '{"v": 2}'])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+      return httpx.Response(200, text=next(bodies), headers={'ETag': '"x"'})
+
+    zp = AsyncZP(skip_credential_check=True, cache=cache)
+    transport = httpx.MockTransport(handler)
+    await zp.init_client(httpx.AsyncClient(transport=transport))
+    url = 'https://zwiftpower.com/cache3/teams/5_riders.json'
+
+    assert await zp.fetch_json(url) == '{"v": 1}'
+    now[0] += 3601
+    assert await zp.fetch_json(url) == '{"v": 2}'
+    assert cache.get(url) == '{"v": 2}'
+    await zp.close()
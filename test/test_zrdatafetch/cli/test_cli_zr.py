@@ -204,3 +204,23 @@ class TestCLIEntryPoint:
     with patch('sys.argv', ['zrdata']):
       result = main()
       assert result is None
+
+
+# ===============================================================================
+class TestCLIAutoStrategy:
+  """Test the --auto rider fetch strategy option."""
+
+  def test_auto_noaction(self, capsys):
+    """Test --auto with --noaction describes the strategy fetch."""
+    with patch('sys.argv', ['zrdata', 'rider', '--auto', '--noaction', '1', '2']):
+      result = main()
+    assert result is None
+    assert 'fastest mix' in capsys.readouterr().out
+
+  def test_auto_uses_fetch_many(self, capsys):
+    """Test --auto routes rider IDs through ZRRider.fetch_many."""
+    with patch('sys.argv', ['zrdata', 'rider', '--auto', '1', '2']):
+      with patch('zrdatafetch.cli.ZRRider.fetch_many', return_value={}) as fm:
+        result = main()
+    assert result is None
+    fm.assert_called_once_with(1, 2)
@@ -0,0 +1,131 @@
+"""Tests for the Zwiftracing response cache in AsyncZR_obj."""
+
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.cache import (
+  ZRResponseCache,
+  get_default_cache,
+  set_default_cache,
+)
+
+
+class FakeClock:
+  """Manually advanced clock for TTL tests."""
+
+  def __init__(self) -> None:
+    self.now = 1000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+async def _session(
+  cache: ZRResponseCache,
+  handler: Callable[[httpx.Request], httpx.Response],
+) -> AsyncZR_obj:
+  """AsyncZR_obj wired to a MockTransport handler."""
+  zr = AsyncZR_obj(cache=cache)
+  await zr.init_client(
+    httpx.AsyncClient(
+      base_url='https://api.zwiftracing.app/api',
+      transport=httpx.MockTransport(handler),
+    ),
+  )
+  return zr
+
+
+# ===============================================================================
+class TestZRResponseCache:
+  """Test endpoint families."""
+
+  @pytest.mark.parametrize(
+    ('path', 'family'),
+    [
+      ('/public/riders/123', 'riders'),
+      ('/public/riders/123/1704067200', 'riders'),
+      ('/public/results/99', 'results'),
+      ('/public/clubs/5/0', 'clubs'),
+      ('/public/other', 'other'),
+    ],
+  )
+  def test_family_for(self, path, family):
+    assert ZRResponseCache().family_for(path) == family
+
+  def test_default_cache(self):
+    cache = ZRResponseCache()
+    set_default_cache(cache)
+    try:
+      assert get_default_cache() is cache
+      assert AsyncZR_obj().cache is cache
+    finally:
+      set_default_cache(None)
+
+
+# ===============================================================================
+class TestAsyncZRFetchJsonCache:
+  """Test caching and revalidation in AsyncZR_obj.fetch_json."""
+
+  @pytest.mark.anyio
+  async def test_fresh_get_served_from_cache(self):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+      calls.append(request.url.path)
+      return httpx.Response(200, text='{"riderId": 1}')
+
+    zr = await _session(ZRResponseCache(), handler)
+    async with zr:
+      await zr.fetch_json('/public/riders/1')
+      await zr.fetch_json('/public/riders/1')
+
+    assert calls == ['/api/public/riders/1']
+    # The cache hit does not spend rate limit quota
+    status = zr.rate_limiter.get_status()['endpoints']['riders_get']
+    assert status['used'] == 1
+
+  @pytest.mark.anyio
+  async def test_stale_get_revalidated(self):
+    clock = FakeClock()
+    cache = ZRResponseCache(clock=clock)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+      seen.append(request.headers.get('If-Modified-Since'))
+      if request.headers.get('If-Modified-Since'):
+        return httpx.Response(304)
+      return httpx.Response(
+        200,
+        text='{"riderId": 5}',
+        headers={'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+      )
+
+    zr = await _session(cache, handler)
+    async with zr:
+      first = await zr.fetch_json('/public/riders/5')
+      clock.now += 301
+      second = await zr.fetch_json('/public/riders/5')
+
+    assert first == second == '{"riderId": 5}'
+    assert seen == [None, 'Mon, 01 Jan 2024 00:00:00 GMT']
+    assert cache.stats.revalidated == 1
+
+  @pytest.mark.anyio
+  async def test_post_not_cached(self):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+      calls.append(request.method)
+      return httpx.Response(200, text='[]')
+
+    cache = ZRResponseCache()
+    zr = await _session(cache, handler)
+    async with zr:
+      await zr.fetch_json('/public/riders', method='POST', json=[1])
+      await zr.fetch_json('/public/riders', method='POST', json=[1])
+
+    assert calls == ['POST', 'POST']
+    assert cache.stats.stores == 0
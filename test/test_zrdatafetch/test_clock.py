@@ -0,0 +1,82 @@
+"""Tests for SystemClock and VirtualClock."""
+
+import anyio
+import pytest
+
+from zrdatafetch.clock import SystemClock, VirtualClock
+
+
+# ===============================================================================
+class TestSystemClock:
+  """Test SystemClock uses real time."""
+
+  @pytest.mark.anyio
+  async def test_sleep_and_time(self):
+    clock = SystemClock()
+    start = clock.monotonic()
+    await clock.sleep(0.01)
+    assert clock.monotonic() > start
+    assert clock.time() > 1_600_000_000
+
+
+# ===============================================================================
+class TestVirtualClock:
+  """Test VirtualClock time control."""
+
+  def test_starts_at_given_time(self):
+    clock = VirtualClock(start=100.0)
+    assert clock.time() == 100.0
+    assert clock.monotonic() == 100.0
+    assert clock.elapsed == 0.0
+
+  def test_advance(self):
+    clock = VirtualClock()
+    clock.advance(30)
+    assert clock.time() == 30.0
+
+  def test_advance_rejects_negative(self):
+    with pytest.raises(ValueError, match='backwards'):
+      VirtualClock().advance(-1)
+
+  @pytest.mark.anyio
+  async def test_advance_wakes_due_sleepers(self):
+    clock = VirtualClock()
+    woken = []
+
+    async def sleeper(seconds: float) -> None:
+      await clock.sleep(seconds)
+      woken.append(seconds)
+
+    async with anyio.create_task_group() as tg:
+      tg.start_soon(sleeper, 10)
+      tg.start_soon(sleeper, 20)
+      await anyio.wait_all_tasks_blocked()
+      clock.advance(15)
+      await anyio.wait_all_tasks_blocked()
+      assert woken == [10]
+      clock.advance(5)
+
+    assert woken == [10, 20]
+
+  @pytest.mark.anyio
+  async def test_run_jumps_to_each_deadline(self):
+    clock = VirtualClock()
+    wakeups = []
+
+    async def sleeper(seconds: float) -> None:
+      await clock.sleep(seconds)
+      wakeups.append(clock.time())
+
+    async def workload() -> str:
+      async with anyio.create_task_group() as tg:
+        tg.start_soon(sleeper, 3600)
+        tg.start_soon(sleeper, 60)
+        tg.start_soon(sleeper, 900)
+      return 'done'
+
+    with anyio.fail_after(10):
+      result = await clock.run(workload)
+
+    assert result == 'done'
+    assert wakeups == [60, 900, 3600]
+    assert clock.elapsed == 3600
@@ -0,0 +1,169 @@
+"""Tests for RiderCoalescer batching of single-rider fetches."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anyio
+import pytest
+
+from shared.exceptions import NetworkError
+from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.coalescer import RiderCoalescer
+from zrdatafetch.zrrider import ZRRider
+
+
+def _rider_payload(zwift_id: int, name: str) -> dict:
+  """Build a minimal batch response entry for one rider."""
+  return {
+    'riderId': zwift_id,
+    'name': name,
+    'gender': 'M',
+    'power': {'compoundScore': 100.0},
+    'race': {
+      'current': {'rating': 1500.0, 'mixed': {'category': 'B'}},
+      'max30': {'rating': 1600.0, 'mixed': {'category': 'B'}},
+      'max90': {'rating': 1700.0, 'mixed': {'category': 'A'}},
+    },
+  }
+
+
+def _mock_batch_session() -> AsyncMock:
+  """Session whose POST echoes back one rider per requested ID."""
+  mock_zr = AsyncMock(spec=AsyncZR_obj)
+
+  async def fetch_json(endpoint, **kwargs) -> str:  # noqa: ANN003
+    return json.dumps([_rider_payload(i, f'Rider {i}') for i in kwargs['json']])
+
+  mock_zr.fetch_json = AsyncMock(side_effect=fetch_json)
+  return mock_zr
+
+
+@pytest.fixture
+def mock_config():
+  with patch('zrdatafetch.zrrider.Config') as mock_config_class:
+    config = MagicMock()
+    config.authorization = 'test-token'
+    mock_config_class.return_value = config
+    yield config
+
+
+# ===============================================================================
+class TestRiderCoalescerInit:
+  """Test RiderCoalescer construction."""
+
+  def test_defaults(self):
+    coalescer = RiderCoalescer()
+    assert coalescer.window == 0.1
+    assert coalescer.max_batch == 1000
+
+  def test_rejects_oversized_batch(self):
+    with pytest.raises(ValueError, match='max_batch'):
+      RiderCoalescer(max_batch=1001)
+
+  def test_rejects_negative_window(self):
+    with pytest.raises(ValueError, match='window'):
+      RiderCoalescer(window=-1)
+
+
+# ===============================================================================
+class TestRiderCoalescerFetch:
+  """Test merging of concurrent fetches."""
+
+  @pytest.mark.anyio
+  async def test_concurrent_fetches_share_one_post(self, mock_config):
+    mock_zr = _mock_batch_session()
+    coalescer = RiderCoalescer(mock_zr, window=0.01)
+    riders = {zid: ZRRider(zwift_id=zid) for zid in (11, 22, 33)}
+
+    async with anyio.create_task_group() as tg:
+      for rider in riders.values():
+        rider.set_coalescer(coalescer)
+        tg.start_soon(rider.afetch)
+
+    mock_zr.fetch_json.assert_called_once()
+    call_args = mock_zr.fetch_json.call_args
+    assert call_args[0][0] == '/public/riders'
+    assert call_args[1]['method'] == 'POST'
+    assert sorted(call_args[1]['json']) == [11, 22, 33]
+    for zid, rider in riders.items():
+      assert rider.zwift_id == zid
+      assert rider.name == f'Rider {zid}'
+      assert rider.max30_rating == 1600.0
+
+  @pytest.mark.anyio
+  async def test_epochs_are_batched_separately(self, mock_config):
+    mock_zr = _mock_batch_session()
+    coalescer = RiderCoalescer(mock_zr, window=0.01)
+
+    async with anyio.create_task_group() as tg:
+      tg.start_soon(coalescer.fetch, 11)
+      tg.start_soon(coalescer.fetch, 22, 1704067200)
+      tg.start_soon(coalescer.fetch, 33, -1)
+
+    endpoints = sorted(c[0][0] for c in mock_zr.fetch_json.call_args_list)
+    assert endpoints == ['/public/riders', '/public/riders/1704067200']
+
+  @pytest.mark.anyio
+  async def test_duplicate_ids_sent_once(self, mock_config):
+    mock_zr = _mock_batch_session()
+    coalescer = RiderCoalescer(mock_zr, window=0.01)
+
+    async with anyio.create_task_group() as tg:
+      tg.start_soon(coalescer.fetch, 11)
+      tg.start_soon(coalescer.fetch, 11)
+
+    assert mock_zr.fetch_json.call_args[1]['json'] == [11]
+
+  @pytest.mark.anyio
+  async def test_full_batch_sent_without_waiting(self, mock_config):
+    mock_zr = _mock_batch_session()
+    coalescer = RiderCoalescer(mock_zr, window=60, max_batch=2)
+
+    with anyio.fail_after(5):
+      async with anyio.create_task_group() as tg:
+        tg.start_soon(coalescer.fetch, 11)
+        tg.start_soon(coalescer.fetch, 22)
+
+    assert sorted(mock_zr.fetch_json.call_args[1]['json']) == [11, 22]
+
+  @pytest.mark.anyio
+  async def test_missing_rider_raises(self, mock_config):
+    mock_zr = AsyncMock(spec=AsyncZR_obj)
+    mock_zr.fetch_json = AsyncMock(return_value='[]')
+    coalescer = RiderCoalescer(mock_zr, window=0)
+
+    with pytest.raises(NetworkError, match='not found'):
+      await coalescer.fetch(11)
+
+  @pytest.mark.anyio
+  async def test_batch_error_reaches_all_callers(self, mock_config):
+    mock_zr = AsyncMock(spec=AsyncZR_obj)
+    mock_zr.fetch_json = AsyncMock(side_effect=NetworkError('boom'))
+    coalescer = RiderCoalescer(mock_zr, window=0.01)
+    errors = []
+
+    async def fetch(zwift_id) -> None:
+      try:
+        await coalescer.fetch(zwift_id)
+      except NetworkError as e:
+        errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+      tg.start_soon(fetch, 11)
+      tg.start_soon(fetch, 22)
+
+    assert len(errors) == 2
+    mock_zr.fetch_json.assert_called_once()
+
+
+# ===============================================================================
+class TestZRRiderBatchRiderId:
+  """Test batch responses are keyed by riderId."""
+
+  def test_fetch_batch_keys_by_rider_id(self, mock_config):
+    payload = json.dumps([_rider_payload(11, 'A'), _rider_payload(22, 'B')])
+    with patch('zrdatafetch.zrrider.ZRRider.fetch_json', return_value=payload):
+      riders = ZRRider.fetch_batch(11, 22)
+
+    assert set(riders) == {11, 22}
+    assert riders[22].name == 'B'
@@ -1,6 +1,10 @@
 """Tests for RateLimiter class."""
 
-from zrdatafetch.rate_limiter import RateLimiter
+import pytest
+
+from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.clock import VirtualClock
+from zrdatafetch.rate_limiter import GCRARateLimiter, RateLimiter
 
 
 # ===============================================================================
@@ -287,3 +291,95 @@ class TestRateLimiterConcurrency:
 
     # results should still be available
     assert limiter.can_request('results') is True
+
+
+# ===============================================================================
+@pytest.fixture
+def clock():
+  """Virtual clock that only moves when advanced."""
+  return VirtualClock(start=1000.0)
+
+
+# ===============================================================================
+class TestGCRARateLimiter:
+  """Test GCRARateLimiter behavior."""
+
+  def test_init(self):
+    """Test tier and burst are stored."""
+    limiter = GCRARateLimiter(tier='premium', burst=3)
+    assert limiter.limits == RateLimiter.PREMIUM_LIMITS
+    assert limiter.burst == 3
+    assert isinstance(limiter, RateLimiter)
+
+  def test_rejects_zero_burst(self):
+    """Test burst must be positive."""
+    with pytest.raises(ValueError, match='burst'):
+      GCRARateLimiter(burst=0)
+
+  def test_requests_spaced_by_emission_interval(self, clock):
+    """Test riders_get (5 per 60s) allows one request every 12s."""
+    limiter = GCRARateLimiter(clock=clock)
+    assert limiter.can_request('riders_get') is True
+    limiter.record_request('riders_get')
+
+    assert limiter.can_request('riders_get') is False
+    assert limiter.wait_time('riders_get') == pytest.approx(12.0)
+
+    clock.advance(12.0)
+    assert limiter.can_request('riders_get') is True
+
+  def test_burst_allows_back_to_back_requests(self, clock):
+    """Test burst requests are allowed before throttling."""
+    limiter = GCRARateLimiter(burst=3, clock=clock)
+    for _ in range(3):
+      assert limiter.can_request('riders_get') is True
+      limiter.record_request('riders_get')
+
+    assert limiter.can_request('riders_get') is False
+    assert limiter.wait_time('riders_get') == pytest.approx(12.0)
+
+  def test_never_exceeds_window_limit(self, clock):
+    """Test default burst never exceeds the sliding window limit."""
+    limiter = GCRARateLimiter(clock=clock)
+    sent = []
+    for _ in range(600):
+      if limiter.can_request('riders_get'):
+        limiter.record_request('riders_get')
+        sent.append(clock.time())
+      clock.advance(1.0)
+
+    for i, start in enumerate(sent):
+      in_window = [t for t in sent[i:] if t - start < 60]
+      assert len(in_window) <= 5
+
+  def test_unknown_endpoint(self, clock):
+    """Test endpoints without limits are never throttled."""
+    limiter = GCRARateLimiter(clock=clock)
+    limiter.record_request('unknown')
+    assert limiter.can_request('unknown') is True
+    assert limiter.wait_time('unknown') == 0.0
+
+  def test_get_status(self, clock):
+    """Test status reports used, remaining and reset times."""
+    limiter = GCRARateLimiter(burst=2, clock=clock)
+    status = limiter.get_status()['endpoints']['riders_get']
+    assert status['used'] == 0
+    assert status['remaining'] == 2
+    assert status['limit'] == 5
+
+    limiter.record_request('riders_get')
+    status = limiter.get_status()['endpoints']['riders_get']
+    assert status['used'] == 1
+    assert status['remaining'] == 1
+    assert status['reset_in_seconds'] == pytest.approx(12.0)
+
+    limiter.record_request('riders_get')
+    status = limiter.get_status()['endpoints']['riders_get']
+    assert status['remaining'] == 0
+    assert status['reset_in_seconds'] == pytest.approx(12.0)
+
+  def test_injected_into_async_zr(self):
+    """Test AsyncZR_obj accepts a custom rate limiter."""
+    limiter = GCRARateLimiter()
+    zr = AsyncZR_obj(rate_limiter=limiter)
+    assert zr.rate_limiter is limiter
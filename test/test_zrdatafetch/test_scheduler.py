@@ -0,0 +1,187 @@
+"""Tests for FairScheduler multi-tenant request scheduling."""
+
+import anyio
+import pytest
+
+from shared.exceptions import NetworkError
+from zrdatafetch.clock import VirtualClock
+from zrdatafetch.scheduler import FairScheduler
+from zrdatafetch.simulator import SimulatedZRAPI
+
+
+async def _fetch_riders(
+  scheduler: FairScheduler,
+  tenant: str,
+  zwift_ids: range,
+  finished: list[tuple[str, int, float]],
+) -> None:
+  """Fetch riders one after another, recording completion times."""
+  for zwift_id in zwift_ids:
+    await scheduler.fetch_json(tenant, f'/public/riders/{zwift_id}')
+    finished.append((tenant, zwift_id, scheduler.clock.time()))
+
+
+# ===============================================================================
+class TestFairSchedulerSetup:
+  """Test tenant registration and lifecycle."""
+
+  def test_rejects_duplicate_tenant(self):
+    scheduler = FairScheduler()
+    scheduler.add_tenant('a', 'token-a')
+    with pytest.raises(ValueError, match='already registered'):
+      scheduler.add_tenant('a', 'token-b')
+
+  def test_rejects_non_positive_weight(self):
+    with pytest.raises(ValueError, match='weight'):
+      FairScheduler().add_tenant('a', 'token-a', weight=0)
+
+  def test_tenants_share_token_limiter(self):
+    scheduler = FairScheduler()
+    scheduler.add_tenant('a', 'token', tier='premium')
+    scheduler.add_tenant('b', 'token')
+    assert len(scheduler._sessions) == 1
+
+  @pytest.mark.anyio
+  async def test_fetch_requires_running_scheduler(self):
+    scheduler = FairScheduler()
+    scheduler.add_tenant('a', 'token-a')
+    with pytest.raises(RuntimeError, match='not running'):
+      await scheduler.fetch_json('a', '/public/riders/1')
+
+  @pytest.mark.anyio
+  async def test_unknown_tenant(self):
+    async with FairScheduler() as scheduler:
+      with pytest.raises(ValueError, match='Unknown tenant'):
+        await scheduler.fetch_json('nobody', '/public/riders/1')
+
+
+# ===============================================================================
+class TestFairSchedulerDispatch:
+  """Test dispatching against the simulated API on a virtual clock."""
+
+  @pytest.mark.anyio
+  async def test_sends_tenant_token(self):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+
+    async def workload() -> str:
+      async with FairScheduler(api.client(), clock) as scheduler:
+        scheduler.add_tenant('a', 'token-a')
+        return await scheduler.fetch_json('a', '/public/riders/7')
+
+    with anyio.fail_after(10):
+      raw = await clock.run(workload)
+
+    assert '"riderId":7' in raw.replace(' ', '')
+    assert api.count(status=429) == 0
+
+  @pytest.mark.anyio
+  async def test_separate_tokens_have_separate_limits(self):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+    finished: list[tuple[str, int, float]] = []
+
+    async def workload() -> None:
+      async with FairScheduler(api.client(), clock) as scheduler:
+        scheduler.add_tenant('crawl', 'token-a')
+        scheduler.add_tenant('lookup', 'token-b')
+        async with anyio.create_task_group() as tg:
+          tg.start_soon(_fetch_riders, scheduler, 'crawl', range(20), finished)
+          tg.start_soon(_fetch_riders, scheduler, 'lookup', range(2), finished)
+
+    with anyio.fail_after(10):
+      await clock.run(workload)
+
+    lookups = [t for tenant, _, t in finished if tenant == 'lookup']
+    assert lookups == [0, 0]
+    assert api.count(status=429) == 0
+    # 20 GETs at 5 per minute on one token
+    assert clock.elapsed == pytest.approx(180)
+
+  @pytest.mark.anyio
+  async def test_crawl_does_not_starve_lookup_on_shared_token(self):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+    finished: list[tuple[str, int, float]] = []
+
+    async def burst(scheduler: FairScheduler, tenant: str, count: int) -> None:
+      async with anyio.create_task_group() as tg:
+        for zwift_id in range(count):
+          tg.start_soon(
+            _fetch_riders,
+            scheduler,
+            tenant,
+            range(zwift_id, zwift_id + 1),
+            finished,
+          )
+
+    async def workload() -> None:
+      async with FairScheduler(api.client(), clock) as scheduler:
+        scheduler.add_tenant('crawl', 'shared')
+        scheduler.add_tenant('lookup', 'shared')
+        async with anyio.create_task_group() as tg:
+          tg.start_soon(burst, scheduler, 'crawl', 20)
+          await clock.sleep(1)
+          tg.start_soon(burst, scheduler, 'lookup', 2)
+
+    with anyio.fail_after(10):
+      await clock.run(workload)
+
+    lookups = [t for tenant, _, t in finished if tenant == 'lookup']
+    assert len(lookups) == 2
+    # FIFO would finish the lookups after all 20 crawl requests (240s)
+    assert max(lookups) <= 60
+    assert api.count(status=429) == 0
+
+  @pytest.mark.anyio
+  async def test_weights_share_capacity(self):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+
+    async def flood(scheduler: FairScheduler, tenant: str) -> None:
+      async with anyio.create_task_group() as tg:
+        for zwift_id in range(30):
+          endpoint = f'/public/riders/{zwift_id}'
+          tg.start_soon(scheduler.fetch_json, tenant, endpoint)
+
+    async def workload() -> dict:
+      async with FairScheduler(api.client(), clock) as scheduler:
+        scheduler.add_tenant('heavy', 'shared', weight=2)
+        scheduler.add_tenant('light', 'shared')
+        async with anyio.create_task_group() as tg:
+          tg.start_soon(flood, scheduler, 'heavy')
+          tg.start_soon(flood, scheduler, 'light')
+          await clock.sleep(115)
+          status = scheduler.get_status()
+          tg.cancel_scope.cancel()
+        return status
+
+    with anyio.fail_after(10):
+      status = await clock.run(workload)
+
+    # 10 slots so far (5 per minute), shared 2:1
+    assert status['heavy']['served'] + status['light']['served'] == 10
+    assert status['heavy']['served'] in (6, 7)
+
+  @pytest.mark.anyio
+  async def test_queued_requests_fail_on_exit(self):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+    errors = []
+
+    async def fetch(scheduler: FairScheduler, zwift_id: int) -> None:
+      try:
+        await scheduler.fetch_json('a', f'/public/clubs/{zwift_id}/0')
+      except NetworkError as e:
+        errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+      async with FairScheduler(api.client(), clock) as scheduler:
+        scheduler.add_tenant('a', 'token-a')
+        tg.start_soon(fetch, scheduler, 1)
+        tg.start_soon(fetch, scheduler, 2)
+        await anyio.wait_all_tasks_blocked()
+
+    # Standard tier allows 1 clubs request per hour
+    assert len(errors) == 1
+    assert 'stopped' in str(errors[0])
@@ -0,0 +1,108 @@
+"""Tests for the SimulatedZRAPI stand-in and virtual clock workloads."""
+
+from unittest.mock import MagicMock, patch
+
+import anyio
+import pytest
+
+from zrdatafetch.clock import VirtualClock
+from zrdatafetch.simulator import SimulatedZRAPI
+from zrdatafetch.zrrider import ZRRider
+
+
+@pytest.fixture
+def mock_config():
+  with patch('zrdatafetch.zrrider.Config') as mock_config_class:
+    config = MagicMock()
+    config.authorization = 'test-token'
+    mock_config_class.return_value = config
+    yield config
+
+
+# ===============================================================================
+class TestSimulatedZRAPI:
+  """Test the stand-in API responses and rate limits."""
+
+  @pytest.mark.anyio
+  async def test_rider_get(self):
+    api = SimulatedZRAPI(VirtualClock())
+    async with api.client() as client:
+      response = await client.get('/public/riders/123')
+
+    assert response.status_code == 200
+    assert response.json()['riderId'] == 123
+    assert api.count(endpoint='riders_get') == 1
+
+  @pytest.mark.anyio
+  async def test_batch_post(self):
+    api = SimulatedZRAPI(VirtualClock())
+    async with api.client() as client:
+      response = await client.post('/public/riders', json=[1, 2, 3])
+
+    assert [r['riderId'] for r in response.json()] == [1, 2, 3]
+
+  @pytest.mark.anyio
+  async def test_unknown_path(self):
+    api = SimulatedZRAPI(VirtualClock())
+    async with api.client() as client:
+      response = await client.get('/public/nothing')
+
+    assert response.status_code == 404
+
+  @pytest.mark.anyio
+  async def test_enforces_limits_on_virtual_clock(self):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+    async with api.client() as client:
+      statuses = [(await client.get('/public/clubs/1/0')).status_code]
+      statuses.append((await client.get('/public/clubs/1/0')).status_code)
+      clock.advance(3600)
+      statuses.append((await client.get('/public/clubs/1/0')).status_code)
+
+    assert statuses == [200, 429, 200]
+    assert api.count(status=429) == 1
+
+
+# ===============================================================================
+class TestVirtualWorkload:
+  """Test replaying rate limited workloads on a virtual clock."""
+
+  @pytest.mark.anyio
+  async def test_rider_gets_wait_for_window(self, mock_config):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+
+    async def workload() -> list[str]:
+      names = []
+      async with api.session() as zr:
+        for zwift_id in range(1, 11):
+          rider = ZRRider(zwift_id=zwift_id)
+          rider.set_session(zr)
+          await rider.afetch()
+          names.append(rider.name)
+      return names
+
+    with anyio.fail_after(10):
+      names = await clock.run(workload)
+
+    assert names[-1] == 'Simulated Rider 10'
+    assert api.count(status=429) == 0
+    # Standard tier: 5 GETs per minute
+    assert clock.elapsed == pytest.approx(60)
+
+  @pytest.mark.anyio
+  async def test_batch_posts_wait_for_window(self, mock_config):
+    clock = VirtualClock()
+    api = SimulatedZRAPI(clock)
+
+    async def workload() -> None:
+      async with api.session() as zr:
+        await ZRRider.afetch_batch(1, 2, zr=zr)
+        await ZRRider.afetch_batch(3, 4, zr=zr)
+
+    with anyio.fail_after(10):
+      await clock.run(workload)
+
+    assert api.count(endpoint='riders_post', status=200) == 2
+    # Standard tier: 1 POST per 15 minutes
+    assert clock.elapsed == pytest.approx(900)
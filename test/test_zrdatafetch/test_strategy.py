@@ -0,0 +1,126 @@
+"""Tests for quota-aware GET/POST strategy selection."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from zrdatafetch.async_zr import AsyncZR_obj
+from zrdatafetch.rate_limiter import RateLimiter
+from zrdatafetch.strategy import estimate_wait, plan_rider_fetch
+from zrdatafetch.zrrider import ZRRider
+
+
+def _status(limiter: RateLimiter) -> dict:
+  return limiter.get_status()
+
+
+# ===============================================================================
+class TestEstimateWait:
+  """Test estimate_wait() for a single endpoint."""
+
+  def test_within_quota(self):
+    status = _status(RateLimiter())['endpoints']['riders_get']
+    assert estimate_wait(status, 5) == 0.0
+
+  def test_unlimited_endpoint(self):
+    assert estimate_wait(None, 100) == 0.0
+
+  def test_exhausted_window_waits_for_reset(self):
+    limiter = RateLimiter()
+    limiter.record_request('riders_post')
+    status = _status(limiter)['endpoints']['riders_post']
+    assert 890 < estimate_wait(status, 1) <= 900
+
+  def test_multiple_waves(self):
+    status = _status(RateLimiter())['endpoints']['riders_get']
+    # 5 now, then 5 per 60s window: 12 requests need two more windows
+    assert estimate_wait(status, 12) == 120.0
+
+
+# ===============================================================================
+class TestPlanRiderFetch:
+  """Test plan_rider_fetch() choices."""
+
+  def test_handful_with_full_quota_uses_gets(self):
+    plan = plan_rider_fetch(3, _status(RateLimiter()))
+    assert plan.get_count == 3
+    assert plan.post_batches == 0
+    assert plan.estimated_wait == 0.0
+
+  def test_large_set_uses_post(self):
+    plan = plan_rider_fetch(200, _status(RateLimiter()))
+    assert plan.get_count == 0
+    assert plan.post_count == 200
+    assert plan.post_batches == 1
+
+  def test_post_exhausted_small_set_uses_gets(self):
+    limiter = RateLimiter()
+    limiter.record_request('riders_post')
+    plan = plan_rider_fetch(20, _status(limiter))
+    assert plan.get_count == 20
+    assert plan.post_batches == 0
+
+  def test_post_exhausted_large_set_waits_for_post(self):
+    limiter = RateLimiter()
+    limiter.record_request('riders_post')
+    plan = plan_rider_fetch(500, _status(limiter))
+    assert plan.post_count == 500
+
+  def test_remainder_over_batch_size_uses_gets(self):
+    plan = plan_rider_fetch(1003, _status(RateLimiter()))
+    assert plan.get_count == 3
+    assert plan.post_batches == 1
+
+  def test_empty(self):
+    plan = plan_rider_fetch(0, _status(RateLimiter()))
+    assert plan.get_count == 0
+    assert plan.post_count == 0
+
+
+# ===============================================================================
+class TestZRRiderFetchMany:
+  """Test ZRRider.afetch_many() follows the plan."""
+
+  @pytest.mark.anyio
+  async def test_large_set_sent_as_post(self):
+    mock_zr = AsyncMock(spec=AsyncZR_obj)
+    mock_zr.rate_limiter = RateLimiter()
+    mock_zr.fetch_json = AsyncMock(
+      return_value=json.dumps(
+        [{'riderId': i, 'name': f'R{i}', 'race': {}} for i in range(1, 51)],
+      ),
+    )
+
+    with patch('zrdatafetch.zrrider.Config') as mock_config_class:
+      mock_config = MagicMock()
+      mock_config.authorization = 'test-token'
+      mock_config_class.return_value = mock_config
+
+      riders = await ZRRider.afetch_many(*range(1, 51), zr=mock_zr)
+
+    mock_zr.fetch_json.assert_called_once()
+    assert mock_zr.fetch_json.call_args[1]['method'] == 'POST'
+    assert len(riders) == 50
+
+  @pytest.mark.anyio
+  async def test_handful_sent_as_gets(self):
+    mock_zr = AsyncMock(spec=AsyncZR_obj)
+    mock_zr.rate_limiter = RateLimiter()
+    mock_zr.fetch_json = AsyncMock(return_value='{"name": "R", "race": {}}')
+
+    with patch('zrdatafetch.zrrider.Config') as mock_config_class:
+      mock_config = MagicMock()
+      mock_config.authorization = 'test-token'
+      mock_config_class.return_value = mock_config
+
+      riders = await ZRRider.afetch_many(11, 22, 11, zr=mock_zr)
+
+    assert mock_zr.fetch_json.call_count == 2
+    endpoints = sorted(c[0][0] for c in mock_zr.fetch_json.call_args_list)
+    assert endpoints == ['/public/riders/11', '/public/riders/22']
+    assert set(riders) == {11, 22}
+
+  @pytest.mark.anyio
+  async def test_no_ids(self):
+    assert await ZRRider.afetch_many() == {}